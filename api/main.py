@@ -5,27 +5,188 @@ Coach Database API
 FastAPI service for querying college football coaching data.
 """
 
-from fastapi import FastAPI, Query, HTTPException, Header
+from fastapi import FastAPI, Query, HTTPException, Header, Request, Response, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+from pydantic import BaseModel, ConfigDict
 from typing import Optional, List
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
+from contextlib import asynccontextmanager, contextmanager
+import functools
+import hashlib
+import hmac
 import logging
 import os
+import queue
+import threading
+import time
 import libsql_experimental as libsql
+import orjson
 
 # Turso (libSQL) connection config
 TURSO_DB_URL = os.environ.get("TURSO_DATABASE_URL")
 TURSO_AUTH_TOKEN = os.environ.get("TURSO_AUTH_TOKEN", "")
 DEFAULT_DB_PATH = Path(__file__).parent.parent / 'db' / 'coaches.db'
 
+# Long-lived connections kept warm between requests (LIFO so the most recently
+# used connection, with the hottest page cache, is handed out first).
+DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", "8"))
+
+# How long slow-changing reference data (aggregate counts etc.) is memoized.
+REFERENCE_TTL_SECONDS = int(os.environ.get("REFERENCE_TTL_SECONDS", "300"))
+# Upper bound on the memoized, already-encoded /coaches response bodies
+# (each up to ~600 KB); keeps them well inside the 256 MB Fly VM.
+COACHES_JSON_CACHE_BYTES = int(os.environ.get("COACHES_JSON_CACHE_BYTES", str(16 * 1024 * 1024)))
+
+# Shared secret for POST /api/webhooks/staff-update; unset disables the webhook.
+WEBHOOK_API_KEY = os.environ.get("WEBHOOK_API_KEY", "")
+
+# Sent on slow-changing endpoints so browsers and CDNs can absorb repeat reads.
+CACHE_CONTROL = os.environ.get("CACHE_CONTROL", "public, max-age=600, stale-while-revalidate=3600")
+
+# Applied once per local SQLite connection; Turso manages its own storage.
+LOCAL_PRAGMAS = (
+    # Worker processes share the file; wait on locks rather than failing.
+    # First, so that the journal_mode switch below waits too.
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+    # Enforce the schema's REFERENCES clauses on webhook writes.
+    "PRAGMA foreign_keys=ON",
+)
+
+# Idempotent schema objects the API relies on, applied at startup so the
+# Turso database and local dev copies stay in step with db/schema.sql.
+API_MIGRATIONS = (
+    # Most recent salary row per coach (by year, then source_date, then id).
+    # The id is recovered from the MAX of a sortable key so the whole table is
+    # aggregated in one pass instead of probing salaries once per coach row.
+    """
+    CREATE VIEW IF NOT EXISTS latest_salary AS
+    SELECT s.*
+    FROM salaries s
+    JOIN (
+        SELECT CAST(substr(MAX(
+                   printf('%04d', year) || char(1) || COALESCE(source_date, '')
+                   || char(1) || printf('%020d', id)
+               ), -20) AS INTEGER) AS id
+        FROM salaries
+        GROUP BY coach_id
+    ) latest ON latest.id = s.id
+    """,
+    # Composite indexes for the (school, year) / (coach, year) filters and
+    # career lookups by name. Each leads with the column of a baseline
+    # single-column index, which is dropped as redundant; no query filters on
+    # year first, so the (year, school) index only cost writes.
+    "DROP INDEX IF EXISTS idx_coaches_year_school",
+    "DROP INDEX IF EXISTS idx_coaches_school",
+    "DROP INDEX IF EXISTS idx_coaches_name",
+    "DROP INDEX IF EXISTS idx_salaries_coach",
+    "CREATE INDEX IF NOT EXISTS idx_coaches_school_year_head ON coaches(school_id, year, is_head_coach)",
+    "CREATE INDEX IF NOT EXISTS idx_coaches_name_year ON coaches(name, year)",
+    "CREATE INDEX IF NOT EXISTS idx_salaries_coach_year ON salaries(coach_id, year DESC, source_date DESC, id DESC)",
+    # Conference filters on /schools and /salaries, and the /salaries
+    # ORDER BY total_pay DESC LIMIT walk.
+    "CREATE INDEX IF NOT EXISTS idx_schools_conference ON schools(conference_id)",
+    "CREATE INDEX IF NOT EXISTS idx_salaries_total_pay ON salaries(total_pay DESC)",
+    # Case-insensitive school and per-school coach lookups in the webhook.
+    "CREATE INDEX IF NOT EXISTS idx_schools_name_nocase ON schools(name COLLATE NOCASE)",
+    "CREATE INDEX IF NOT EXISTS idx_coaches_school_name_nocase ON coaches(school_id, name COLLATE NOCASE)",
+    # Trigram full-text index over coach names backing /search. The trigram
+    # tokenizer answers LIKE '%q%' from the index, so substring semantics are
+    # unchanged. Triggers keep the external-content table in sync.
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS coach_fts USING fts5(
+        name, content='coaches', content_rowid='id', tokenize='trigram'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS coach_fts_ai AFTER INSERT ON coaches BEGIN
+        INSERT INTO coach_fts(rowid, name) VALUES (new.id, new.name);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS coach_fts_ad AFTER DELETE ON coaches BEGIN
+        INSERT INTO coach_fts(coach_fts, rowid, name) VALUES ('delete', old.id, old.name);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS coach_fts_au AFTER UPDATE OF name ON coaches BEGIN
+        INSERT INTO coach_fts(coach_fts, rowid, name) VALUES ('delete', old.id, old.name);
+        INSERT INTO coach_fts(rowid, name) VALUES (new.id, new.name);
+    END
+    """,
+)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Pre-warm the connection pool on startup and drain it on shutdown."""
+    warm_pool()
+    ensure_schema()
+    yield
+    close_pool()
+
 app = FastAPI(
     title="Coach Database API",
     description="College football coaching staff and salary data",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
+class ETagMiddleware(BaseHTTPMiddleware):
+    """Tag successful GET responses with a weak ETag of the body.
+
+    Clients that send a matching If-None-Match get an empty 304 instead of
+    the full payload.
+    """
+
+    async def dispatch(self, request: Request, call_next):
+        response = await call_next(request)
+        if request.method != "GET" or response.status_code != 200:
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        etag = f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        headers = dict(response.headers)
+        headers["etag"] = etag
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and _etag_matches(if_none_match, etag):
+            headers.pop("content-length", None)
+            headers.pop("content-type", None)
+            return Response(status_code=304, headers=headers)
+
+        return Response(
+            content=body,
+            status_code=response.status_code,
+            headers=headers,
+            media_type=response.media_type,
+        )
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against our ETag."""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+# Registered before CORS so 304s still pass through the CORS middleware.
+app.add_middleware(ETagMiddleware)
+
+# The full /coaches listing is ~600 KB of JSON; compress anything non-trivial.
+# Sits outside ETagMiddleware, so the ETag is taken over the identity body.
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # CORS for web clients
 app.add_middleware(
     CORSMiddleware,
@@ -85,8 +246,8 @@ class StaffUpdate(BaseModel):
     source_url: Optional[str] = None  # Citation URL
     notes: Optional[str] = None  # Additional context
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "school": "Michigan State",
                 "coach_name": "John Smith",
@@ -95,6 +256,25 @@ class StaffUpdate(BaseModel):
                 "source_url": "https://example.com/news/hiring"
             }
         }
+    )
+
+@functools.lru_cache(maxsize=None)
+def _bool_fields(model) -> tuple:
+    return tuple(name for name, field in model.model_fields.items() if field.annotation is bool)
+
+def _coerce_rows(model, rows: list) -> list:
+    """Coerce `model`'s bool fields in place (SQLite stores them as 0/1).
+
+    Row dicts already carry the model's fields in declaration order, so after
+    this they can be serialized directly in the model's JSON shape.
+    """
+    bools = _bool_fields(model)
+    if bools:
+        for data in rows:
+            for name in bools:
+                if name in data:
+                    data[name] = bool(data[name])
+    return rows
 
 logger = logging.getLogger("coachdb.webhooks")
 logging.basicConfig(level=logging.INFO)
@@ -147,6 +327,29 @@ class _DictCursor:
         cols = self._cols()
         return [_DictRow(r, cols) for r in (self._cur.fetchall() or [])]
 
+    def fetchall_dicts(self):
+        """Fetch all rows as plain dicts, zipping against one column tuple.
+
+        Cheaper than fetchall() + dict(row) when rows are only serialized.
+        """
+        cols = tuple(self._cols())
+        return [dict(zip(cols, r)) for r in (self._cur.fetchall() or [])]
+
+    def iter_dicts(self, size: int = 256):
+        """Yield rows as plain dicts, pulling ``size`` rows per fetchmany().
+
+        Only one batch of raw tuples is alive at a time, so large listings
+        never hold the full tuple list and the full dict list together.
+        """
+        cols = tuple(self._cols())
+        for batch in iter(lambda: self._cur.fetchmany(size), []):
+            for r in batch:
+                yield dict(zip(cols, r))
+
+    def fetchall_tuples(self):
+        """Fetch all rows as raw tuples for callers that unpack by position."""
+        return [tuple(r) for r in (self._cur.fetchall() or [])]
+
     @property
     def lastrowid(self):
         return self._cur.lastrowid
@@ -172,51 +375,224 @@ class _DictConn:
     def commit(self):
         self._conn.commit()
 
+    def rollback(self):
+        self._conn.rollback()
+
     def close(self):
         self._conn.close()
 
 
-def get_db() -> _DictConn:
+# One read-write connection plus N readers: read routes never contend with
+# the webhook for the write lock.
+_POOL: "queue.LifoQueue[_DictConn]" = queue.LifoQueue(maxsize=DB_POOL_SIZE)
+_WRITE_POOL: "queue.LifoQueue[_DictConn]" = queue.LifoQueue(maxsize=1)
+
+
+def connect_db(readonly: bool = False) -> _DictConn:
     """Connect to Turso (cloud) or fall back to local SQLite file for dev."""
     if TURSO_DB_URL:
         conn = libsql.connect(TURSO_DB_URL, auth_token=TURSO_AUTH_TOKEN)
     else:
         conn = libsql.connect(f"file:{DEFAULT_DB_PATH}")
+        for pragma in LOCAL_PRAGMAS:
+            conn.execute(pragma)
+        if readonly:
+            conn.execute("PRAGMA query_only = ON")
     return _DictConn(conn)
 
+def get_db(write: bool = False) -> _DictConn:
+    """Check a connection out of the pool, opening a new one if it is empty."""
+    pool = _WRITE_POOL if write else _POOL
+    try:
+        return pool.get_nowait()
+    except queue.Empty:
+        return connect_db(readonly=not write)
+
+def release_db(conn: _DictConn, write: bool = False) -> None:
+    """Return a connection to the pool, closing it if the pool is already full."""
+    pool = _WRITE_POOL if write else _POOL
+    try:
+        pool.put_nowait(conn)
+    except queue.Full:
+        conn.close()
+
+@contextmanager
+def pooled_conn(write: bool = False):
+    """Borrow a pooled connection for the duration of a `with` block.
+
+    Reader connections are opened with query_only; pass write=True for
+    anything that modifies the database. Any open transaction is rolled back
+    on error so the connection goes back to the pool clean.
+    """
+    conn = get_db(write)
+    try:
+        yield conn
+    except BaseException:
+        try:
+            conn.rollback()
+        except Exception:
+            conn.close()
+            conn = None
+        raise
+    finally:
+        if conn is not None:
+            release_db(conn, write)
+
+def warm_pool() -> None:
+    """Open connections up front so the first requests skip connect costs."""
+    while not _POOL.full():
+        try:
+            _POOL.put_nowait(connect_db(readonly=True))
+        except queue.Full:
+            break
+
+def ensure_schema() -> None:
+    """Apply API_MIGRATIONS on the write connection."""
+    with pooled_conn(write=True) as conn:
+        has_fts = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'coach_fts'"
+        ).fetchone()
+        for statement in API_MIGRATIONS:
+            conn.execute(statement)
+        if not has_fts:
+            # Backfill existing coaches the first time the index is created.
+            conn.execute("INSERT INTO coach_fts(coach_fts) VALUES ('rebuild')")
+        conn.commit()
+        if not TURSO_DB_URL:
+            # Refresh planner stats where they are missing or stale; readers
+            # are query_only so this runs once here on the write connection.
+            conn.execute("PRAGMA optimize=0x10002")
+
+def close_pool() -> None:
+    for pool in (_POOL, _WRITE_POOL):
+        while True:
+            try:
+                pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+# --- In-process caching ---
+
+_TTL_CACHED = []
+
+def ttl_cache(seconds: float, maxsize: int = 256, maxbytes: Optional[int] = None):
+    """Memoize a function's result per argument tuple for `seconds`.
+
+    Expiry is tracked with time.monotonic(); at most `maxsize` argument tuples
+    are kept (oldest evicted first), and with `maxbytes` the total len() of
+    the cached values (e.g. encoded bodies) is capped as well. Misses are
+    computed under a per-key lock so concurrent requests for the same cold key
+    wait for one query instead of stampeding the database, while misses for
+    other keys proceed in parallel. `fn.cache_clear()` drops every entry, and
+    `clear_caches()` does so for every decorated function. A result whose
+    computation overlapped a cache_clear() is returned but not stored, since
+    it may predate the write that triggered the clear.
+    """
+    def decorator(fn):
+        entries = {}
+        # args -> [lock, number of callers using it]; the registry lock only
+        # guards this dict and the bookkeeping, never a call to fn.
+        key_locks = {}
+        registry = threading.Lock()
+        generation = 0
+        nbytes = 0
+
+        @functools.wraps(fn)
+        def wrapper(*args):
+            nonlocal nbytes
+            hit = entries.get(args)
+            if hit is not None and time.monotonic() - hit[0] < seconds:
+                return hit[1]
+            with registry:
+                slot = key_locks.get(args)
+                if slot is None:
+                    slot = key_locks[args] = [threading.Lock(), 0]
+                slot[1] += 1
+            try:
+                with slot[0]:
+                    hit = entries.get(args)
+                    if hit is not None and time.monotonic() - hit[0] < seconds:
+                        return hit[1]
+                    started = generation
+                    value = fn(*args)
+                    size = len(value) if maxbytes is not None else 0
+                    with registry:
+                        if generation == started and (maxbytes is None or size <= maxbytes):
+                            old = entries.pop(args, None)
+                            if old is not None:
+                                nbytes -= old[2]
+                            entries[args] = (time.monotonic(), value, size)
+                            nbytes += size
+                            while len(entries) > maxsize or (maxbytes is not None and nbytes > maxbytes):
+                                nbytes -= entries.pop(next(iter(entries)))[2]
+                return value
+            finally:
+                with registry:
+                    slot[1] -= 1
+                    if not slot[1]:
+                        del key_locks[args]
+
+        def cache_clear():
+            nonlocal generation, nbytes
+            with registry:
+                generation += 1
+                entries.clear()
+                nbytes = 0
+
+        wrapper.cache_clear = cache_clear
+        _TTL_CACHED.append(wrapper)
+        return wrapper
+    return decorator
+
+def clear_caches() -> None:
+    """Invalidate all ttl_cache entries (called after writes)."""
+    for fn in _TTL_CACHED:
+        fn.cache_clear()
+
+def cacheable(response: Response) -> None:
+    """Route dependency that marks the response as publicly cacheable."""
+    response.headers["Cache-Control"] = CACHE_CONTROL
+
+# Webhook payloads repeat the same handful of schools and titles, so the
+# normalizers below are memoized; their lookup tables are built once.
+_SCHOOL_SLUG_OVERRIDES = {
+    'miami (fl)': 'miami',
+    'miami (oh)': 'miami-oh',
+    'ole miss': 'mississippi',
+    'north carolina state': 'nc-state',
+    'army west point': 'army',
+}
+
+_POSITION_ALIASES = {
+    "hc": "Head Coach",
+    "head coach": "Head Coach",
+    "oc": "Offensive Coordinator",
+    "dc": "Defensive Coordinator",
+    "st": "Special Teams Coordinator",
+    "stc": "Special Teams Coordinator",
+    "co-oc": "Co-Offensive Coordinator",
+    "co-dc": "Co-Defensive Coordinator",
+}
+
+@functools.lru_cache(maxsize=2048)
 def normalize_school_name(name: str) -> str:
     """Normalize school names to slugs."""
     name = name.lower().strip()
-    replacements = {
-        'miami (fl)': 'miami',
-        'miami (oh)': 'miami-oh',
-        'ole miss': 'mississippi',
-        'north carolina state': 'nc-state',
-        'army west point': 'army',
-    }
-    return replacements.get(name, name.replace(' ', '-'))
+    slug = _SCHOOL_SLUG_OVERRIDES.get(name)
+    return slug if slug is not None else name.replace(' ', '-')
 
+@functools.lru_cache(maxsize=2048)
 def normalize_person_name(name: str) -> str:
     """Normalize coach names for consistent comparisons."""
     return " ".join(name.strip().split())
 
+@functools.lru_cache(maxsize=2048)
 def standardize_position(position: Optional[str]) -> Optional[str]:
     """Standardize position labels where possible."""
     if not position:
         return None
     cleaned = " ".join(position.strip().split())
-    key = cleaned.lower()
-    mapping = {
-        "hc": "Head Coach",
-        "head coach": "Head Coach",
-        "oc": "Offensive Coordinator",
-        "dc": "Defensive Coordinator",
-        "st": "Special Teams Coordinator",
-        "stc": "Special Teams Coordinator",
-        "co-oc": "Co-Offensive Coordinator",
-        "co-dc": "Co-Defensive Coordinator",
-    }
-    return mapping.get(key, cleaned)
+    return _POSITION_ALIASES.get(cleaned.lower(), cleaned)
 
 def parse_iso_date(value: Optional[str], field_name: str) -> None:
     if value is None:
@@ -226,6 +602,7 @@ def parse_iso_date(value: Optional[str], field_name: str) -> None:
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=f"Invalid {field_name} format (YYYY-MM-DD)") from exc
 
+@functools.lru_cache(maxsize=2048)
 def is_head_coach_position(position: Optional[str]) -> bool:
     if not position:
         return False
@@ -247,8 +624,10 @@ def root():
         "version": "1.0.0"
     }
 
+# Plain def: FastAPI runs it in the threadpool, so waiting on the SQLite write
+# lock (busy_timeout) never blocks the event loop serving reads.
 @app.post("/api/webhooks/staff-update")
-async def webhook_staff_update(
+def webhook_staff_update(
     update: StaffUpdate,
     api_key: str = Header(..., alias="X-API-Key")
 ):
@@ -258,14 +637,16 @@ async def webhook_staff_update(
     Requires authentication via X-API-Key header.
     Validates payload, deduplicates, and updates database.
     """
-    received_at = datetime.utcnow().isoformat() + "Z"
-    logger.info("Webhook staff update received at %s", received_at)
-
-    expected_key = os.environ.get("WEBHOOK_API_KEY", "")
-    if not expected_key or api_key != expected_key:
-        logger.warning("Webhook staff update rejected: invalid API key at %s", received_at)
+    # Reject unauthenticated calls before any other work.
+    if not WEBHOOK_API_KEY or not hmac.compare_digest(api_key.encode(), WEBHOOK_API_KEY.encode()):
+        logger.warning("Webhook staff update rejected: invalid API key")
         raise HTTPException(status_code=401, detail="Invalid API key")
 
+    # One clock read serves both the log timestamp and the season year.
+    now = datetime.now(timezone.utc)
+    received_at = now.replace(tzinfo=None).isoformat() + "Z"
+    logger.info("Webhook staff update received at %s", received_at)
+
     if not update.school or not update.school.strip():
         logger.warning("Webhook staff update rejected: missing school at %s", received_at)
         raise HTTPException(status_code=400, detail="School is required")
@@ -281,66 +662,98 @@ async def webhook_staff_update(
     coach_name = normalize_person_name(update.coach_name)
     position = standardize_position(update.position)
     is_head_coach = is_head_coach_position(position)
-    current_year = datetime.utcnow().year
+    current_year = now.year
 
-    conn = None
     try:
-        conn = get_db()
-        school_row = conn.execute(
-            "SELECT id, name, slug FROM schools WHERE slug = ?",
-            (school_slug,)
-        ).fetchone()
-        if not school_row:
+        with pooled_conn(write=True) as conn:
+            if not TURSO_DB_URL:
+                # Take the write lock before the dedup SELECT so concurrent
+                # writers queue here (busy_timeout) instead of racing between
+                # the lookup and the write; errors roll back via pooled_conn.
+                conn.execute("BEGIN IMMEDIATE")
+            # Slug match first, falling back to a case-insensitive name match.
             school_row = conn.execute(
-                "SELECT id, name, slug FROM schools WHERE LOWER(name) = LOWER(?)",
-                (update.school.strip(),)
-            ).fetchone()
-        if not school_row:
-            logger.warning("Webhook staff update rejected: school not found (%s)", school_slug)
-            raise HTTPException(status_code=404, detail="School not found")
-
-        school_id = school_row["id"]
-
-        if position is None:
-            existing = conn.execute(
-                """
-                SELECT * FROM coaches
-                WHERE school_id = ? AND LOWER(name) = LOWER(?) AND position IS NULL
-                ORDER BY year DESC, id DESC
-                LIMIT 1
-                """,
-                (school_id, coach_name)
-            ).fetchone()
-        else:
-            existing = conn.execute(
                 """
-                SELECT * FROM coaches
-                WHERE school_id = ? AND LOWER(name) = LOWER(?) AND LOWER(position) = LOWER(?)
-                ORDER BY year DESC, id DESC
+                SELECT id, name, slug FROM schools
+                WHERE slug = ?1 OR name = ?2 COLLATE NOCASE
+                ORDER BY slug = ?1 DESC
                 LIMIT 1
                 """,
-                (school_id, coach_name, position)
+                (school_slug, update.school.strip())
             ).fetchone()
+            if not school_row:
+                logger.warning("Webhook staff update rejected: school not found (%s)", school_slug)
+                raise HTTPException(status_code=404, detail="School not found")
+
+            school_id = school_row["id"]
+
+            if position is None:
+                existing = conn.execute(
+                    """
+                    SELECT * FROM coaches
+                    WHERE school_id = ? AND name = ? COLLATE NOCASE AND position IS NULL
+                    ORDER BY year DESC, id DESC
+                    LIMIT 1
+                    """,
+                    (school_id, coach_name)
+                ).fetchone()
+            else:
+                existing = conn.execute(
+                    """
+                    SELECT * FROM coaches
+                    WHERE school_id = ? AND name = ? COLLATE NOCASE AND position = ? COLLATE NOCASE
+                    ORDER BY year DESC, id DESC
+                    LIMIT 1
+                    """,
+                    (school_id, coach_name, position)
+                ).fetchone()
+
+            if existing:
+                existing_name = normalize_person_name(existing["name"])
+                existing_position = existing["position"] if existing["position"] is not None else None
+                matches = (
+                    existing_name == coach_name
+                    and existing_position == position
+                    and int(existing["is_head_coach"] or 0) == int(is_head_coach)
+                    and (existing["year"] or current_year) == current_year
+                )
+                if matches:
+                    conn.rollback()
+                    logger.info(
+                        "Webhook staff update no_change for %s (%s) at %s",
+                        coach_name,
+                        school_slug,
+                        received_at
+                    )
+                    return {
+                        "status": "no_change",
+                        "message": "Coach already in database",
+                        "details": {
+                            "school_slug": school_slug,
+                            "position": position,
+                            "year": current_year
+                        }
+                    }
 
-        if existing:
-            existing_name = normalize_person_name(existing["name"])
-            existing_position = existing["position"] if existing["position"] is not None else None
-            matches = (
-                existing_name == coach_name
-                and existing_position == position
-                and int(existing["is_head_coach"] or 0) == int(is_head_coach)
-                and (existing["year"] or current_year) == current_year
-            )
-            if matches:
+                conn.execute(
+                    """
+                    UPDATE coaches
+                    SET name = ?, position = ?, is_head_coach = ?, year = ?
+                    WHERE id = ?
+                    """,
+                    (coach_name, position, int(is_head_coach), current_year, existing["id"])
+                )
+                conn.commit()
+                clear_caches()
                 logger.info(
-                    "Webhook staff update no_change for %s (%s) at %s",
-                    coach_name,
-                    school_slug,
+                    "Webhook staff update updated coach_id=%s at %s",
+                    existing["id"],
                     received_at
                 )
                 return {
-                    "status": "no_change",
-                    "message": "Coach already in database",
+                    "status": "updated",
+                    "message": "Coach record updated",
+                    "coach_id": existing["id"],
                     "details": {
                         "school_slug": school_slug,
                         "position": position,
@@ -348,89 +761,59 @@ async def webhook_staff_update(
                     }
                 }
 
-            conn.execute(
+            cursor = conn.cursor()
+            cursor.execute(
                 """
-                UPDATE coaches
-                SET name = ?, position = ?, is_head_coach = ?, year = ?
-                WHERE id = ?
+                INSERT INTO coaches (name, school_id, position, is_head_coach, year)
+                VALUES (?, ?, ?, ?, ?)
                 """,
-                (coach_name, position, int(is_head_coach), current_year, existing["id"])
+                (coach_name, school_id, position, int(is_head_coach), current_year)
             )
             conn.commit()
+            clear_caches()
+            coach_id = cursor.lastrowid
             logger.info(
-                "Webhook staff update updated coach_id=%s at %s",
-                existing["id"],
+                "Webhook staff update created coach_id=%s at %s",
+                coach_id,
                 received_at
             )
             return {
-                "status": "updated",
-                "message": "Coach record updated",
-                "coach_id": existing["id"],
+                "status": "created",
+                "message": "Coach record created",
+                "coach_id": coach_id,
                 "details": {
                     "school_slug": school_slug,
                     "position": position,
                     "year": current_year
                 }
             }
-
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO coaches (name, school_id, position, is_head_coach, year)
-            VALUES (?, ?, ?, ?, ?)
-            """,
-            (coach_name, school_id, position, int(is_head_coach), current_year)
-        )
-        conn.commit()
-        coach_id = cursor.lastrowid
-        logger.info(
-            "Webhook staff update created coach_id=%s at %s",
-            coach_id,
-            received_at
-        )
-        return {
-            "status": "created",
-            "message": "Coach record created",
-            "coach_id": coach_id,
-            "details": {
-                "school_slug": school_slug,
-                "position": position,
-                "year": current_year
-            }
-        }
     except HTTPException:
         raise
     except Exception as exc:
         logger.exception("Webhook staff update failed due to database error at %s", received_at)
         raise HTTPException(status_code=500, detail="Database error") from exc
-    finally:
-        if conn:
-            conn.close()
 
-@app.get("/stats")
+@ttl_cache(REFERENCE_TTL_SECONDS)
+def load_stats() -> dict:
+    # One statement: coaches is scanned once with conditional counts.
+    with pooled_conn() as conn:
+        row = conn.execute('''
+            SELECT (SELECT COUNT(*) FROM schools) as schools,
+                   COALESCE(SUM(CASE WHEN is_head_coach = 1 THEN 1 ELSE 0 END), 0) as head_coaches,
+                   COALESCE(SUM(CASE WHEN is_head_coach = 0 THEN 1 ELSE 0 END), 0) as assistants,
+                   (SELECT COUNT(*) FROM salaries) as salaries
+            FROM coaches
+        ''').fetchone()
+    
+    return dict(row)
+
+@app.get("/stats", dependencies=[Depends(cacheable)])
 def get_stats():
     """Get database statistics."""
-    conn = get_db()
-    stats = {}
-    
-    stats['schools'] = conn.execute('SELECT COUNT(*) FROM schools').fetchone()[0]
-    stats['head_coaches'] = conn.execute('SELECT COUNT(*) FROM coaches WHERE is_head_coach = 1').fetchone()[0]
-    stats['assistants'] = conn.execute('SELECT COUNT(*) FROM coaches WHERE is_head_coach = 0').fetchone()[0]
-    stats['salaries'] = conn.execute('SELECT COUNT(*) FROM salaries').fetchone()[0]
-    
-    conn.close()
-    return stats
+    return load_stats()
 
-@app.get("/coaches", response_model=List[Coach])
-def list_coaches(
-    school: Optional[str] = Query(None, description="Filter by school slug"),
-    position: Optional[str] = Query(None, description="Filter by position (partial match)"),
-    head_only: bool = Query(False, description="Only return head coaches"),
-    limit: int = Query(2500, le=3000, description="Max results (default 2500 to include all coaches)")
-):
-    """List coaches with optional filters."""
-    conn = get_db()
-    
+def _coaches_query(head_only: bool) -> str:
+    """SQL for the full /coaches ordering, optionally head coaches only."""
     query = '''
         SELECT c.id, c.name, s.name as school, s.slug as school_slug,
                c.position, c.is_head_coach, c.year, conf.abbrev as conference,
@@ -442,71 +825,148 @@ def list_coaches(
         FROM coaches c
         LEFT JOIN schools s ON c.school_id = s.id
         LEFT JOIN conferences conf ON s.conference_id = conf.id
-        LEFT JOIN salaries sal ON sal.id = (
-            SELECT id
-            FROM salaries s2
-            WHERE s2.coach_id = c.id
-            ORDER BY s2.year DESC, COALESCE(s2.source_date, '') DESC, s2.id DESC
-            LIMIT 1
-        )
-        WHERE 1=1
+        LEFT JOIN latest_salary sal ON sal.coach_id = c.id
     '''
-    params = []
-    
-    if school:
-        query += ' AND s.slug = ?'
-        params.append(school)
-    
-    if position:
-        query += ' AND c.position LIKE ?'
-        params.append(f'%{position}%')
-    
     if head_only:
-        query += ' AND c.is_head_coach = 1'
+        query += ' WHERE c.is_head_coach = 1'
     
     # Order by: head coaches first, then by salary (if any), then alphabetically
-    query += ' ORDER BY c.is_head_coach DESC, COALESCE(sal.total_pay, 0) DESC, s.name ASC, c.name ASC LIMIT ?'
-    params.append(limit)
+    query += ' ORDER BY c.is_head_coach DESC, COALESCE(sal.total_pay, 0) DESC, s.name ASC, c.name ASC, c.id'
+    return query
+
+# School and position filters are applied to the memoized listing, so only
+# the head_only split needs its own statement.
+LIST_COACHES_SQL = {head_only: _coaches_query(head_only) for head_only in (False, True)}
+
+# SQLite's LIKE folds ASCII letters only.
+_ASCII_LOWER = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+
+def _find_like_segment(text: str, segment: str, start: int) -> int:
+    """Index of the first match of `segment` in `text` at or after `start`, or -1.
+
+    ``_`` in `segment` matches any single character; the rest is literal.
+    Candidates are located with str.find on the first literal run, so the
+    cost stays linear in len(text) * len(segment).
+    """
+    if "_" not in segment:
+        return text.find(segment, start)
+    lead = segment.lstrip("_")
+    skip = len(segment) - len(lead)
+    last = len(text) - len(segment)
+    anchor = lead.split("_", 1)[0]
+    if not anchor:
+        return start if start <= last else -1
+    while True:
+        i = text.find(anchor, start + skip)
+        if i < 0 or i - skip > last:
+            return -1
+        candidate = i - skip
+        if all(p == "_" or p == t for p, t in zip(segment, text[candidate:candidate + len(segment)])):
+            return candidate
+        start = candidate + 1
+
+@functools.lru_cache(maxsize=256)
+def _like_matcher(needle: str):
+    """Predicate for SQLite's ``position LIKE '%needle%'``.
+
+    Mirrors LIKE exactly: ``%`` and ``_`` stay wildcards and case folding is
+    ASCII-only, so filtering the memoized listing returns the rows the SQL
+    filter did. The ``%``-separated segments are matched left to right (the
+    leftmost match of each is always the right one), so needles full of
+    ``%`` can't backtrack the way a ``.*`` regex does.
+    """
+    segments = [seg for seg in needle.translate(_ASCII_LOWER).split("%") if seg]
+
+    def matches(value: str) -> bool:
+        value = value.translate(_ASCII_LOWER)
+        pos = 0
+        for segment in segments:
+            i = _find_like_segment(value, segment, pos)
+            if i < 0:
+                return False
+            pos = i + len(segment)
+        return True
+
+    return matches
+
+@ttl_cache(REFERENCE_TTL_SECONDS)
+def load_coach_listing(head_only: bool) -> list:
+    """The complete /coaches ordering (no school/position filter).
+
+    The ORDER BY spans coaches, salaries and schools, so no single index can
+    stream it; sorting once per TTL window (or write) is the cheap option.
+    """
+    with pooled_conn() as conn:
+        cur = conn.execute(LIST_COACHES_SQL[head_only])
+        rows = list(cur.iter_dicts())
+    return _coerce_rows(Coach, rows)
+
+@ttl_cache(REFERENCE_TTL_SECONDS)
+def load_coach_index() -> tuple:
+    """Lookups over the memoized listing: (rows by id, sorted rows by school slug).
+
+    This is the denormalized coaches/schools/conferences/salary view kept in
+    process, so per-school listings and single-coach reads skip the joins.
+    It is rebuilt with the listing, i.e. after every webhook write.
+    """
+    by_id = {}
+    by_school = {}
+    for row in load_coach_listing(False):
+        by_id[row['id']] = row
+        by_school.setdefault(row['school_slug'], []).append(row)
+    return by_id, by_school
+
+@app.get("/coaches", response_model=List[Coach], dependencies=[Depends(cacheable)])
+def list_coaches(
+    school: Optional[str] = Query(None, description="Filter by school slug"),
+    position: Optional[str] = Query(None, description="Filter by position (partial match)"),
+    head_only: bool = Query(False, description="Only return head coaches"),
+    limit: int = Query(2500, le=3000, description="Max results (default 2500 to include all coaches)")
+):
+    """List coaches with optional filters."""
+    # Any limit at or above the full listing size returns the same body, so
+    # fold those (and negative limits) into one cache key.
+    if limit < 0 or limit >= len(load_coach_listing(False)):
+        limit = -1
+    return Response(
+        load_coaches_json(school, position, bool(head_only), limit),
+        media_type="application/json",
+        headers={"Cache-Control": CACHE_CONTROL},
+    )
+
+@ttl_cache(REFERENCE_TTL_SECONDS, maxbytes=COACHES_JSON_CACHE_BYTES)
+def load_coaches_json(school: Optional[str], position: Optional[str], head_only: bool, limit: int) -> bytes:
+    """Encoded /coaches body per query; repeat queries skip filtering and JSON encoding."""
+    # Every filter narrows the memoized, already-sorted listing instead of
+    # re-running the joins and the sort per request.
+    if school:
+        rows = load_coach_index()[1].get(school, [])
+        if head_only:
+            rows = [row for row in rows if row['is_head_coach']]
+    else:
+        rows = load_coach_listing(head_only)
     
-    rows = conn.execute(query, tuple(params)).fetchall()
-    conn.close()
+    if position:
+        # Substring matches can't use an index, and a position code column
+        # can't express titles like "Offensive Coordinator/QBs"; scanning the
+        # cached rows skips the joins and the latest-salary materialization.
+        matches = _like_matcher(position)
+        rows = [row for row in rows if row['position'] is not None and matches(row['position'])]
     
-    return [Coach(**dict(row)) for row in rows]
+    # SQLite treats a negative LIMIT as no limit.
+    return orjson.dumps(rows if limit < 0 else rows[:limit])
 
-@app.get("/coaches/{coach_id}", response_model=Coach)
+@app.get("/coaches/{coach_id}", response_model=Coach, dependencies=[Depends(cacheable)])
 def get_coach(coach_id: int):
     """Get a specific coach by ID."""
-    conn = get_db()
-    
-    row = conn.execute('''
-        SELECT c.id, c.name, s.name as school, s.slug as school_slug,
-               c.position, c.is_head_coach, c.year, conf.abbrev as conference,
-               sal.total_pay,
-               sal.year as salary_year,
-               sal.school_pay as salary_school_pay,
-               sal.source as salary_source,
-               sal.source_date as salary_source_date
-        FROM coaches c
-        LEFT JOIN schools s ON c.school_id = s.id
-        LEFT JOIN conferences conf ON s.conference_id = conf.id
-        LEFT JOIN salaries sal ON sal.id = (
-            SELECT id
-            FROM salaries s2
-            WHERE s2.coach_id = c.id
-            ORDER BY s2.year DESC, COALESCE(s2.source_date, '') DESC, s2.id DESC
-            LIMIT 1
-        )
-        WHERE c.id = ?
-    ''', (coach_id,)).fetchone()
-    
-    conn.close()
+    row = load_coach_index()[0].get(coach_id)
     
     if not row:
         raise HTTPException(status_code=404, detail="Coach not found")
     
-    return Coach(**dict(row))
+    return ORJSONResponse(row, headers={"Cache-Control": CACHE_CONTROL})
 
-@app.get("/coaches/{coach_id}/career", response_model=List[CareerStint])
+@app.get("/coaches/{coach_id}/career", response_model=List[CareerStint], dependencies=[Depends(cacheable)])
 def get_coach_career(coach_id: int):
     """Get a coach's career history (grouped stints) by coach ID.
 
@@ -514,246 +974,270 @@ def get_coach_career(coach_id: int):
     across multiple seasons (`year`), and groups consecutive years for the same
     school + position into a single stint.
     """
-    conn = get_db()
-
-    coach_row = conn.execute('SELECT name FROM coaches WHERE id = ?', (coach_id,)).fetchone()
-    if not coach_row:
-        conn.close()
-        raise HTTPException(status_code=404, detail="Coach not found")
-
-    name = coach_row['name']
-    rows = conn.execute('''
-        SELECT c.year, c.position, c.is_head_coach,
-               s.name as school, s.slug as school_slug
-        FROM coaches c
-        LEFT JOIN schools s ON c.school_id = s.id
-        WHERE c.name = ?
-        ORDER BY c.year ASC, COALESCE(s.name, '') ASC, COALESCE(c.position, '') ASC
-    ''', (name,)).fetchall()
-    conn.close()
-
-    # De-dupe identical entries (common when multiple sources load the same job).
-    seen = set()
-    records = []
-    for r in rows:
-        key = (r['year'], r['school_slug'], r['school'], r['position'], int(r['is_head_coach'] or 0))
-        if key in seen:
-            continue
-        seen.add(key)
-        records.append(dict(r))
-
-    stints: list[dict] = []
-    current = None
-    for rec in records:
-        year = rec.get('year')
-        if year is None:
-            continue
-        school = rec.get('school') or 'Unknown'
-        school_slug = rec.get('school_slug')
-        position = rec.get('position')
-
-        if current:
-            same_place = (current['school_slug'], current['school'], current['position']) == (school_slug, school, position)
-            consecutive = year == current['end_year'] + 1
-            if same_place and consecutive:
-                current['end_year'] = year
-                continue
-            stints.append(current)
-
-        current = {
-            "school": school,
-            "school_slug": school_slug,
-            "position": position,
-            "start_year": year,
-            "end_year": year,
-        }
-
-    if current:
-        stints.append(current)
+    with pooled_conn() as conn:
+        coach_row = conn.execute('SELECT name FROM coaches WHERE id = ?', (coach_id,)).fetchone()
+        if not coach_row:
+            raise HTTPException(status_code=404, detail="Coach not found")
+
+        # Gaps-and-islands: within a school + position, consecutive years share
+        # the same (year - row_number) value, so each island is one stint.
+        rows = conn.execute('''
+            WITH dedup AS (
+                SELECT DISTINCT c.year, COALESCE(s.name, 'Unknown') as school,
+                       s.slug as school_slug, c.position
+                FROM coaches c
+                LEFT JOIN schools s ON c.school_id = s.id
+                WHERE c.name = ? AND c.year IS NOT NULL
+            ),
+            grp AS (
+                SELECT *, year - ROW_NUMBER() OVER (
+                    PARTITION BY school_slug, school, position ORDER BY year
+                ) as g
+                FROM dedup
+            )
+            SELECT school, school_slug, position,
+                   MIN(year) as start_year, MAX(year) as end_year
+            FROM grp
+            GROUP BY school_slug, school, position, g
+            ORDER BY end_year DESC, start_year DESC, school ASC, COALESCE(position, '') ASC
+        ''', (coach_row['name'],)).fetchall_dicts()
+
+    return ORJSONResponse(rows, headers={"Cache-Control": CACHE_CONTROL})
+
+def _schools_query(by_conference: bool) -> str:
+    """SQL for /schools for one combination of filters."""
+    # One join + GROUP BY over just the filtered schools' coaches (no
+    # correlated probes per row). The head coach is the lowest-id head coach
+    # row, resolved by primary key once the page of schools is cut.
+    where = '\n            WHERE conf.abbrev = ?' if by_conference else ''
+    return f'''
+        SELECT page.id, page.name, page.slug, page.conference,
+               hc.name as head_coach, page.staff_count
+        FROM (
+            SELECT s.id, s.name, s.slug, conf.abbrev as conference,
+                   COUNT(c.id) as staff_count,
+                   MIN(CASE WHEN c.is_head_coach = 1 THEN c.id END) as head_coach_id
+            FROM schools s
+            LEFT JOIN conferences conf ON s.conference_id = conf.id
+            LEFT JOIN coaches c ON c.school_id = s.id{where}
+            GROUP BY s.id
+            ORDER BY s.name LIMIT ?
+        ) page
+        LEFT JOIN coaches hc ON hc.id = page.head_coach_id
+        ORDER BY page.name
+    '''
 
-    stints.sort(key=lambda s: (s['end_year'], s['start_year']), reverse=True)
-    return [CareerStint(**s) for s in stints]
+LIST_SCHOOLS_SQL = {by_conference: _schools_query(by_conference) for by_conference in (False, True)}
 
-@app.get("/schools", response_model=List[School])
+@app.get("/schools", response_model=List[School], dependencies=[Depends(cacheable)])
 def list_schools(
     conference: Optional[str] = Query(None, description="Filter by conference abbrev"),
     limit: int = Query(100, le=500)
 ):
     """List schools with head coach and staff count."""
-    conn = get_db()
-    
-    query = '''
-        SELECT s.id, s.name, s.slug, conf.abbrev as conference,
-               (SELECT name FROM coaches WHERE school_id = s.id AND is_head_coach = 1 LIMIT 1) as head_coach,
-               (SELECT COUNT(*) FROM coaches WHERE school_id = s.id) as staff_count
-        FROM schools s
-        LEFT JOIN conferences conf ON s.conference_id = conf.id
-        WHERE 1=1
-    '''
+    # Returning the response directly skips response_model serialization, so
+    # the cacheable() header has to be attached here.
+    return ORJSONResponse(load_schools(conference, limit), headers={"Cache-Control": CACHE_CONTROL})
+
+@ttl_cache(REFERENCE_TTL_SECONDS)
+def load_schools(conference: Optional[str], limit: int) -> list:
     params = []
-    
     if conference:
-        query += ' AND conf.abbrev = ?'
         params.append(conference)
-    
-    query += ' ORDER BY s.name LIMIT ?'
     params.append(limit)
+    query = LIST_SCHOOLS_SQL[bool(conference)]
     
-    rows = conn.execute(query, tuple(params)).fetchall()
-    conn.close()
+    with pooled_conn() as conn:
+        rows = conn.execute(query, tuple(params)).fetchall_dicts()
     
-    return [School(**dict(row)) for row in rows]
+    return _coerce_rows(School, rows)
 
-@app.get("/schools/{slug}")
+_SCHOOL_FIELDS = ("id", "name", "slug", "conference")
+_STAFF_FIELDS = (
+    "id", "name", "position", "is_head_coach", "total_pay", "salary_year",
+    "salary_school_pay", "salary_source", "salary_source_date",
+)
+
+@app.get("/schools/{slug}", dependencies=[Depends(cacheable)])
 def get_school(slug: str):
     """Get school details with full staff."""
-    conn = get_db()
-    
-    school = conn.execute('''
-        SELECT s.id, s.name, s.slug, conf.abbrev as conference
-        FROM schools s
-        LEFT JOIN conferences conf ON s.conference_id = conf.id
-        WHERE s.slug = ?
-    ''', (slug,)).fetchone()
-    
-    if not school:
-        conn.close()
+    school = load_school(slug)
+    if school is None:
         raise HTTPException(status_code=404, detail="School not found")
+    return ORJSONResponse(school, headers={"Cache-Control": CACHE_CONTROL})
+
+@ttl_cache(REFERENCE_TTL_SECONDS)
+def load_school(slug: str) -> Optional[dict]:
+    """School detail payload for /schools/{slug}, or None if unknown.
+
+    Callers must treat the returned dict as read-only.
+    """
+    # School and staff come back in one round trip: the school columns repeat
+    # on every row, and a school with no staff yields a single NULL-staff row.
+    with pooled_conn() as conn:
+        rows = conn.execute('''
+            SELECT s.id, s.name, s.slug, conf.abbrev as conference,
+                   c.id, c.name, c.position, c.is_head_coach,
+                   sal.total_pay,
+                   sal.year as salary_year,
+                   sal.school_pay as salary_school_pay,
+                   sal.source as salary_source,
+                   sal.source_date as salary_source_date
+            FROM schools s
+            LEFT JOIN conferences conf ON s.conference_id = conf.id
+            LEFT JOIN coaches c ON c.school_id = s.id
+            LEFT JOIN latest_salary sal ON sal.coach_id = c.id
+            WHERE s.slug = ?
+            ORDER BY c.is_head_coach DESC, c.position
+        ''', (slug,)).fetchall_tuples()
     
-    staff = conn.execute('''
-        SELECT c.id, c.name, c.position, c.is_head_coach,
-               sal.total_pay,
-               sal.year as salary_year,
-               sal.school_pay as salary_school_pay,
-               sal.source as salary_source,
-               sal.source_date as salary_source_date
-        FROM coaches c
-        LEFT JOIN salaries sal ON sal.id = (
-            SELECT id
-            FROM salaries s2
-            WHERE s2.coach_id = c.id
-            ORDER BY s2.year DESC, COALESCE(s2.source_date, '') DESC, s2.id DESC
-            LIMIT 1
-        )
-        WHERE c.school_id = ?
-        ORDER BY c.is_head_coach DESC, c.position
-    ''', (school['id'],)).fetchall()
-    
-    conn.close()
+    if not rows:
+        return None
     
     return {
-        **dict(school),
-        "staff": [dict(row) for row in staff]
+        **dict(zip(_SCHOOL_FIELDS, rows[0][:4])),
+        "staff": [
+            dict(zip(_STAFF_FIELDS, values[4:]))
+            for values in rows
+            if values[4] is not None
+        ]
     }
 
-@app.get("/salaries", response_model=List[Salary])
+# A single statement for every filter combination: unset filters are bound as
+# NULL and short-circuit. salaries is small and walked in total_pay order via
+# idx_salaries_total_pay either way, so one plan serves all variants.
+LIST_SALARIES_SQL = '''
+    SELECT c.name as coach_name, s.name as school, 
+           sal.total_pay, sal.school_pay, sal.max_bonus, sal.buyout
+    FROM salaries sal
+    JOIN coaches c ON sal.coach_id = c.id
+    JOIN schools s ON c.school_id = s.id
+    LEFT JOIN conferences conf ON s.conference_id = conf.id
+    WHERE (?1 IS NULL OR sal.total_pay >= ?1)
+      AND (?2 IS NULL OR conf.abbrev = ?2)
+    ORDER BY sal.total_pay DESC, sal.id
+    LIMIT ?3
+'''
+
+@app.get("/salaries", response_model=List[Salary], dependencies=[Depends(cacheable)])
 def list_salaries(
     min_pay: Optional[int] = Query(None, description="Minimum total pay"),
     conference: Optional[str] = Query(None, description="Filter by conference"),
     limit: int = Query(50, le=200)
 ):
     """List head coach salaries."""
-    conn = get_db()
-    
-    query = '''
-        SELECT c.name as coach_name, s.name as school, 
-               sal.total_pay, sal.school_pay, sal.max_bonus, sal.buyout
-        FROM salaries sal
-        JOIN coaches c ON sal.coach_id = c.id
-        JOIN schools s ON c.school_id = s.id
-        LEFT JOIN conferences conf ON s.conference_id = conf.id
-        WHERE 1=1
-    '''
-    params = []
-    
-    if min_pay:
-        query += ' AND sal.total_pay >= ?'
-        params.append(min_pay)
-    
-    if conference:
-        query += ' AND conf.abbrev = ?'
-        params.append(conference)
-    
-    query += ' ORDER BY sal.total_pay DESC LIMIT ?'
-    params.append(limit)
+    # Falsy filters (including min_pay=0) mean "no filter", as before.
+    params = (min_pay or None, conference or None, limit)
     
-    rows = conn.execute(query, tuple(params)).fetchall()
-    conn.close()
+    with pooled_conn() as conn:
+        rows = conn.execute(LIST_SALARIES_SQL, params).fetchall_dicts()
     
-    return [Salary(**dict(row)) for row in rows]
+    return ORJSONResponse(_coerce_rows(Salary, rows), headers={"Cache-Control": CACHE_CONTROL})
 
-@app.get("/search")
+@app.get("/search", dependencies=[Depends(cacheable)])
 def search(
     q: str = Query(..., min_length=2, description="Search query"),
     limit: int = Query(20, le=100)
 ):
     """Search coaches by name."""
-    conn = get_db()
-    
-    rows = conn.execute('''
-        SELECT c.id, c.name, s.name as school, c.position, c.is_head_coach
-        FROM coaches c
-        LEFT JOIN schools s ON c.school_id = s.id
-        WHERE c.name LIKE ?
-        ORDER BY c.is_head_coach DESC, c.name
-        LIMIT ?
-    ''', (f'%{q}%', limit)).fetchall()
+    with pooled_conn() as conn:
+        rows = conn.execute('''
+            SELECT c.id, c.name, s.name as school, c.position, c.is_head_coach
+            FROM coach_fts f
+            JOIN coaches c ON c.id = f.rowid
+            LEFT JOIN schools s ON c.school_id = s.id
+            WHERE f.name LIKE ?
+            ORDER BY c.is_head_coach DESC, c.name
+            LIMIT ?
+        ''', (f'%{q}%', limit)).fetchall_dicts()
     
-    conn.close()
-    
-    return [dict(row) for row in rows]
+    return ORJSONResponse(rows, headers={"Cache-Control": CACHE_CONTROL})
 
 # --- For YR Call Sheets integration ---
 
 from fastapi.responses import PlainTextResponse
 
-@app.get("/yr/{school_slug}/coaches")
+@functools.lru_cache(maxsize=32)
+def _yr_staff_query(only: Optional[str] = None) -> tuple:
+    """Build the per-label lookup as one UNION ALL of LIMIT 1 subqueries.
+
+    Each branch returns the most recent staff row whose position contains one
+    of the label's keywords, so SQLite stops at the first hit per label.
+    `only` restricts the statement to that single label's branch (no branches
+    at all if it is not a POSITION_MAP label).
+    """
+    from api.position_map import POSITION_MAP
+
+    labels = tuple(
+        (label, keywords) for label, keywords in POSITION_MAP.items()
+        if only is None or label == only
+    )
+    branches = []
+    for label, keywords in labels:
+        matches = " OR ".join("c.position LIKE ?" for _ in keywords)
+        branches.append(f'''
+            SELECT * FROM (
+                SELECT ? as label, c.name
+                FROM coaches c
+                JOIN schools s ON c.school_id = s.id
+                WHERE s.slug = ? AND ({matches})
+                ORDER BY c.year DESC, c.id DESC
+                LIMIT 1
+            )''')
+    return " UNION ALL ".join(branches), labels
+
+
+@ttl_cache(REFERENCE_TTL_SECONDS)
+def load_yr_staff(school_slug: str, only: Optional[str] = None) -> dict:
+    """Map each POSITION_MAP label (or just `only`) to the school's coach name.
+
+    Cached per slug (call sheets poll this often); webhook writes clear it.
+    Callers must treat the returned dict as read-only.
+    """
+    sql, labels = _yr_staff_query(only)
+    if not labels:
+        return {}
+    params = []
+    for label, keywords in labels:
+        params.append(label)
+        params.append(school_slug)
+        params.extend(f"%{k}%" for k in keywords)
+
+    with pooled_conn() as conn:
+        rows = conn.execute(sql, tuple(params)).fetchall()
+
+    found = {row['label']: row['name'] for row in rows}
+    return {label: found[label] for label, _ in labels if label in found}
+
+@app.get("/yr/{school_slug}/coaches", dependencies=[Depends(cacheable)])
 def yr_coaches(
     school_slug: str,
     position: Optional[str] = Query(None, description="Filter to single position (OC, OL, TE, WR, RB, SC)"),
     format: Optional[str] = Query(None, description="Output format: 'text' for plain text lines")
 ):
     """Get offensive coaches for YR Call Sheets integration."""
-    conn = get_db()
-    
-    # Position mapping for YR
-    from api.position_map import POSITION_MAP
-    position_map = POSITION_MAP
-
-    staff = conn.execute('''
-        SELECT c.name, c.position
-        FROM coaches c
-        JOIN schools s ON c.school_id = s.id
-        WHERE s.slug = ?
-        ORDER BY c.year DESC, c.id DESC
-    ''', (school_slug,)).fetchall()
-
-    conn.close()
-
-    result = {}
-    for label, keywords in position_map.items():
-        for row in staff:
-            pos_lower = (row['position'] or '').lower()
-            if any(k in pos_lower for k in keywords):
-                result[label] = row['name']
-                break
-
     # If filtering to single position, return just that value
     if position:
         pos_upper = position.upper()
-        value = result.get(pos_upper, "")
+        value = load_yr_staff(school_slug, pos_upper).get(pos_upper, "")
         if format == 'text':
-            return PlainTextResponse(value)
+            return PlainTextResponse(value, headers={"Cache-Control": CACHE_CONTROL})
         return {pos_upper: value} if value else {}
 
+    result = load_yr_staff(school_slug)
+
     # Return plain text if format=text
     if format == 'text':
         lines = [f"{k}: {v}" for k, v in result.items()]
-        return PlainTextResponse("\n".join(lines))
+        return PlainTextResponse("\n".join(lines), headers={"Cache-Control": CACHE_CONTROL})
 
     return result
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="127.0.0.1", port=8100)
+    # Single process: the ttl_cache memos live in-process and the webhook's
+    # clear_caches() only reaches the process that handled the write, so
+    # extra workers would keep serving pre-write data. "auto" picks uvloop
+    # and httptools when uvicorn[standard] is installed.
+    uvicorn.run(app, host="127.0.0.1", port=8100, loop="auto", http="auto")
@@ -1,3 +1,5 @@
+import re
+
 POSITION_MAP = {
     "HC":  ["head coach"],
     "OC":  ["offensive coord", "offensive coordinator", "play caller", "co-offensive coord"],
@@ -14,10 +16,24 @@ POSITION_MAP = {
     "SC":  ["strength", "conditioning", "strength and conditioning"],
 }
 
+# One compiled alternation per code, built once at import.
+_POSITION_PATTERNS = [
+    (code, re.compile("|".join(map(re.escape, keywords))))
+    for code, keywords in POSITION_MAP.items()
+]
+
+# Every keyword in one alternation: a single scan rejects titles that match
+# no code (analysts, directors, ...) before the ordered per-code search.
+_ANY_POSITION = re.compile("|".join(
+    re.escape(keyword) for keywords in POSITION_MAP.values() for keyword in keywords
+))
+
 def match_position_code(text):
     """Given a position string, return the first matching code from POSITION_MAP, or None."""
     text = (text or '').lower()
-    for code, keywords in POSITION_MAP.items():
-        if any(k in text for k in keywords):
+    if not _ANY_POSITION.search(text):
+        return None
+    for code, pattern in _POSITION_PATTERNS:
+        if pattern.search(text):
             return code
     return None
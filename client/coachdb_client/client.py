@@ -1,9 +1,30 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import json
+import threading
+import time
+from dataclasses import dataclass, field
 from typing import Any, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def _make_session() -> requests.Session:
+    # Keep-alive pool so successive calls reuse one TCP/TLS connection, with
+    # a short backoff on transient upstream errors.
+    retry = Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=(429, 502, 503, 504),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
 
 @dataclass(frozen=True)
@@ -11,6 +32,32 @@ class CoachDBClient:
     base_url: str = "https://coach-database-api.fly.dev"
     api_key: Optional[str] = None
     timeout_s: float = 10.0
+    # GET responses are reused for this long; 0 disables the cache.
+    cache_ttl_s: float = 60.0
+    cache_maxsize: int = 256
+    _session: requests.Session = field(default_factory=_make_session, init=False, repr=False, compare=False)
+    _cache: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    _cache_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+    _base: str = field(default="", init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Fixed per instance: headers ride on the session, the URL prefix is
+        # stripped once.
+        self._session.headers.update(self._headers())
+        object.__setattr__(self, "_base", self.base_url.rstrip("/"))
+
+    def close(self) -> None:
+        self._session.close()
+
+    def clear_cache(self) -> None:
+        with self._cache_lock:
+            self._cache.clear()
+
+    def __enter__(self) -> CoachDBClient:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     def _headers(self) -> dict[str, str]:
         headers: dict[str, str] = {"Accept": "application/json"}
@@ -19,13 +66,33 @@ class CoachDBClient:
         return headers
 
     def _get(self, path: str, params: Optional[dict[str, Any]] = None) -> Any:
-        url = f"{self.base_url.rstrip('/')}{path}"
-        resp = requests.get(url, params=params or {}, headers=self._headers(), timeout=self.timeout_s)
+        # Unset filters are dropped once here, for both the wire and the key.
+        params = {k: v for k, v in (params or {}).items() if v is not None}
+        key = (path, tuple(sorted(params.items())))
+        if self.cache_ttl_s > 0:
+            with self._cache_lock:
+                hit = self._cache.get(key)
+            if hit is not None and time.monotonic() - hit[0] < self.cache_ttl_s:
+                return self._decode(hit[1], hit[2])
+
+        resp = self._session.get(f"{self._base}{path}", params=params, timeout=self.timeout_s)
         resp.raise_for_status()
-        ct = (resp.headers.get("content-type") or "").lower()
-        if "application/json" in ct:
-            return resp.json()
-        return resp.text
+        is_json = "application/json" in (resp.headers.get("content-type") or "").lower()
+        body = resp.content if is_json else resp.text
+
+        if self.cache_ttl_s > 0:
+            # Store the raw body and decode per hit, so callers can mutate
+            # what they get back without corrupting the cache.
+            with self._cache_lock:
+                self._cache.pop(key, None)
+                self._cache[key] = (time.monotonic(), is_json, body)
+                while len(self._cache) > self.cache_maxsize:
+                    self._cache.pop(next(iter(self._cache)))
+        return self._decode(is_json, body)
+
+    @staticmethod
+    def _decode(is_json: bool, body: Any) -> Any:
+        return json.loads(body) if is_json else body
 
     def stats(self) -> dict[str, Any]:
         return self._get("/stats")
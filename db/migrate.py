@@ -34,14 +34,45 @@ CONFERENCE_MAP = {
     'IndFBS': ('IND', 'FBS Independents', 'FBS'),
 }
 
+# Common variations
+SCHOOL_SLUG_OVERRIDES = {
+    'miami (fl)': 'miami',
+    'miami (oh)': 'miami-oh',
+    'ole miss': 'mississippi',
+    'north carolina state': 'nc-state',
+    'army west point': 'army',
+}
+
 def init_db():
     """Create database and tables."""
     conn = sqlite3.connect(DB_PATH)
+    # Bulk-load settings: WAL with NORMAL sync skips the per-commit fsync,
+    # and the larger in-memory cache keeps index pages hot during inserts.
+    conn.executescript('''
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA cache_size=-64000;
+        PRAGMA mmap_size=268435456;
+    ''')
     with open(SCHEMA_PATH) as f:
         conn.executescript(f.read())
     conn.commit()
     return conn
 
+def drop_secondary_indexes(conn):
+    """Drop non-unique indexes before bulk loading; returns their CREATE statements."""
+    # Auto-indexes backing UNIQUE columns have NULL sql and stay in place,
+    # so INSERT OR IGNORE keeps deduplicating on schools.slug
+    rows = conn.execute('''
+        SELECT name, sql FROM sqlite_master
+        WHERE type = 'index' AND sql IS NOT NULL AND sql NOT LIKE 'CREATE UNIQUE%'
+    ''').fetchall()
+    for name, _ in rows:
+        conn.execute(f'DROP INDEX IF EXISTS "{name}"')
+    conn.commit()
+    return [sql for _, sql in rows]
+
 def load_conferences(conn):
     """Load conferences into DB."""
     cursor = conn.cursor()
@@ -59,15 +90,8 @@ def load_conferences(conn):
 def normalize_school_name(name):
     """Normalize school names for matching."""
     name = name.lower().strip()
-    # Common variations
-    replacements = {
-        'miami (fl)': 'miami',
-        'miami (oh)': 'miami-oh',
-        'ole miss': 'mississippi',
-        'north carolina state': 'nc-state',
-        'army west point': 'army',
-    }
-    return replacements.get(name, name.replace(' ', '-'))
+    slug = SCHOOL_SLUG_OVERRIDES.get(name)
+    return slug if slug is not None else name.replace(' ', '-')
 
 def load_salary_data(conn, conf_map):
     """Load USA Today salary data."""
@@ -78,43 +102,49 @@ def load_salary_data(conn, conf_map):
     with open(SALARY_JSON) as f:
         data = json.load(f)
     
+    coaches = data.get('coaches', [])
     cursor = conn.cursor()
-    school_map = {}  # school name -> id
-    coach_map = {}   # (name, school) -> id
     
-    for coach in data.get('coaches', []):
+    # Schools in one batch, then one query for their ids
+    school_rows = []
+    for coach in coaches:
         school_name = coach['school']
         conf_abbrev = CONFERENCE_MAP.get(coach.get('conference', ''), ('IND', '', 'FBS'))[0]
-        conf_id = conf_map.get(conf_abbrev)
-        
-        # Insert school
-        slug = normalize_school_name(school_name)
-        cursor.execute('''
-            INSERT OR IGNORE INTO schools (name, slug, conference_id)
-            VALUES (?, ?, ?)
-        ''', (school_name, slug, conf_id))
-        
-        cursor.execute('SELECT id FROM schools WHERE slug = ?', (slug,))
-        school_id = cursor.fetchone()[0]
-        school_map[slug] = school_id
-        
-        # Insert head coach
-        cursor.execute('''
-            INSERT INTO coaches (name, school_id, position, is_head_coach, year)
-            VALUES (?, ?, 'Head Coach', 1, 2025)
-        ''', (coach['coach'], school_id))
-        coach_id = cursor.lastrowid
-        coach_map[(coach['coach'], school_name)] = coach_id
-        
-        # Insert salary
-        cursor.execute('''
-            INSERT INTO salaries (coach_id, year, total_pay, school_pay, max_bonus, bonuses_paid, buyout, source)
-            VALUES (?, 2025, ?, ?, ?, ?, ?, 'usa_today')
-        ''', (coach_id, coach.get('totalPay'), coach.get('schoolPay'), 
-              coach.get('maxBonus'), coach.get('bonusesPaid'), coach.get('buyout')))
+        school_rows.append((school_name, normalize_school_name(school_name), conf_map.get(conf_abbrev)))
+    cursor.executemany('''
+        INSERT OR IGNORE INTO schools (name, slug, conference_id)
+        VALUES (?, ?, ?)
+    ''', school_rows)
+    cursor.execute('SELECT slug, id FROM schools')
+    all_schools = dict(cursor.fetchall())
+    school_map = {slug: all_schools[slug] for _, slug, _ in school_rows}  # slug -> id
+    
+    # Head coaches in multi-row INSERTs; RETURNING hands back the new ids, which
+    # SQLite assigns in insertion order, so sorting them lines up with `coaches`
+    coach_ids = []
+    pairs = list(zip(coaches, school_rows))
+    for start in range(0, len(pairs), 500):
+        chunk = pairs[start:start + 500]
+        cursor.execute(
+            'INSERT INTO coaches (name, school_id, position, is_head_coach, year) VALUES '
+            + ','.join(["(?, ?, 'Head Coach', 1, 2025)"] * len(chunk))
+            + ' RETURNING id',
+            [value for coach, (_, slug, _) in chunk for value in (coach['coach'], school_map[slug])],
+        )
+        coach_ids.extend(sorted(row[0] for row in cursor.fetchall()))
+    salary_rows = [
+        (coach_id, coach.get('totalPay'), coach.get('schoolPay'),
+         coach.get('maxBonus'), coach.get('bonusesPaid'), coach.get('buyout'))
+        for coach_id, coach in zip(coach_ids, coaches)
+    ]
+    
+    cursor.executemany('''
+        INSERT INTO salaries (coach_id, year, total_pay, school_pay, max_bonus, bonuses_paid, buyout, source)
+        VALUES (?, 2025, ?, ?, ?, ?, ?, 'usa_today')
+    ''', salary_rows)
     
     conn.commit()
-    print(f"Loaded {len(data.get('coaches', []))} head coaches with salaries")
+    print(f"Loaded {len(coaches)} head coaches with salaries")
     return school_map
 
 def load_staff_data(conn, school_map):
@@ -130,43 +160,38 @@ def load_staff_data(conn, school_map):
     staff_count = 0
     new_schools = 0
     
-    for slug, team_data in data.items():
-        if slug.startswith('_'):
-            continue
-            
-        # Check if school exists
-        if slug not in school_map:
-            # Add new school (likely FCS or not in USA Today data)
-            school_name = slug.replace('-', ' ').title()
-            cursor.execute('''
-                INSERT OR IGNORE INTO schools (name, slug)
-                VALUES (?, ?)
-            ''', (school_name, slug))
-            cursor.execute('SELECT id FROM schools WHERE slug = ?', (slug,))
-            result = cursor.fetchone()
-            if result:
-                school_map[slug] = result[0]
-                new_schools += 1
-        
+    # Add schools not in the salary data (likely FCS) in one batch
+    teams = [(slug, team_data) for slug, team_data in data.items() if not slug.startswith('_')]
+    missing = [slug for slug, _ in teams if slug not in school_map]
+    cursor.executemany('''
+        INSERT OR IGNORE INTO schools (name, slug)
+        VALUES (?, ?)
+    ''', [(slug.replace('-', ' ').title(), slug) for slug in missing])
+    cursor.execute('SELECT slug, id FROM schools')
+    all_schools = dict(cursor.fetchall())
+    for slug in missing:
+        if slug in all_schools:
+            school_map[slug] = all_schools[slug]
+            new_schools += 1
+    
+    # Schools that already have a 2025 head coach
+    cursor.execute('SELECT DISTINCT school_id FROM coaches WHERE is_head_coach = 1 AND year = 2025')
+    has_hc = {row[0] for row in cursor.fetchall()}
+    
+    # (name, school_id, position, is_head_coach, cpb_scraped_at), in load order
+    coach_rows = []
+    for slug, team_data in teams:
         school_id = school_map.get(slug)
         if not school_id:
             continue
         
         scraped_at = team_data.get('scraped_at')
         
-        # Check if we already have a head coach for this school
-        cursor.execute('''
-            SELECT id FROM coaches WHERE school_id = ? AND is_head_coach = 1 AND year = 2025
-        ''', (school_id,))
-        existing_hc = cursor.fetchone()
-        
         # Add head coach if not exists
         hc_name = team_data.get('head_coach')
-        if hc_name and not existing_hc:
-            cursor.execute('''
-                INSERT INTO coaches (name, school_id, position, is_head_coach, year, cpb_scraped_at)
-                VALUES (?, ?, 'Head Coach', 1, 2025, ?)
-            ''', (hc_name, school_id, scraped_at))
+        if hc_name and school_id not in has_hc:
+            coach_rows.append((hc_name, school_id, 'Head Coach', 1, scraped_at))
+            has_hc.add(school_id)
         
         # Add assistant coaches
         for coach in team_data.get('coaches', []):
@@ -180,12 +205,14 @@ def load_staff_data(conn, school_map):
             if 'Head Coach' in position and 'Assistant' not in position:
                 continue
             
-            cursor.execute('''
-                INSERT INTO coaches (name, school_id, position, is_head_coach, year, cpb_scraped_at)
-                VALUES (?, ?, ?, 0, 2025, ?)
-            ''', (name, school_id, position, scraped_at))
+            coach_rows.append((name, school_id, position, 0, scraped_at))
             staff_count += 1
     
+    cursor.executemany('''
+        INSERT INTO coaches (name, school_id, position, is_head_coach, year, cpb_scraped_at)
+        VALUES (?, ?, ?, ?, 2025, ?)
+    ''', coach_rows)
+    
     conn.commit()
     print(f"Loaded {staff_count} assistant coaches")
     print(f"Added {new_schools} new schools (FCS/other)")
@@ -220,6 +247,8 @@ def main():
     # Initialize
     print("\n1. Creating database schema...")
     conn = init_db()
+    # Build secondary indexes once after the load instead of per inserted row
+    index_sql = drop_secondary_indexes(conn)
     
     # Load conferences
     print("2. Loading conferences...")
@@ -233,6 +262,16 @@ def main():
     print("4. Loading CollegePressBox staff data...")
     load_staff_data(conn, school_map)
     
+    print("5. Rebuilding indexes...")
+    for sql in index_sql:
+        conn.execute(sql)
+    conn.commit()
+    
+    # Planner statistics, so the API's joins pick the composite indexes
+    print("6. Analyzing tables...")
+    conn.execute('ANALYZE')
+    conn.commit()
+    
     # Stats
     print_stats(conn)
     
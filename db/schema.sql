@@ -79,10 +79,47 @@ CREATE TABLE IF NOT EXISTS coaching_trees (
 );
 
 -- Indexes for common queries
-CREATE INDEX IF NOT EXISTS idx_coaches_school ON coaches(school_id);
 CREATE INDEX IF NOT EXISTS idx_coaches_position ON coaches(position);
-CREATE INDEX IF NOT EXISTS idx_coaches_name ON coaches(name);
-CREATE INDEX IF NOT EXISTS idx_salaries_coach ON salaries(coach_id);
 CREATE INDEX IF NOT EXISTS idx_salaries_year ON salaries(year);
 CREATE INDEX IF NOT EXISTS idx_salary_sources_school ON salary_sources(school_id);
 CREATE INDEX IF NOT EXISTS idx_salary_sources_active ON salary_sources(active);
+CREATE INDEX IF NOT EXISTS idx_coaches_school_year_head ON coaches(school_id, year, is_head_coach);
+CREATE INDEX IF NOT EXISTS idx_coaches_name_year ON coaches(name, year);
+CREATE INDEX IF NOT EXISTS idx_salaries_coach_year ON salaries(coach_id, year DESC, source_date DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_schools_conference ON schools(conference_id);
+CREATE INDEX IF NOT EXISTS idx_salaries_total_pay ON salaries(total_pay DESC);
+CREATE INDEX IF NOT EXISTS idx_schools_name_nocase ON schools(name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_coaches_school_name_nocase ON coaches(school_id, name COLLATE NOCASE);
+
+-- Most recent salary per coach (by year, then source_date, then id).
+-- Mirrors API_MIGRATIONS in api/main.py.
+CREATE VIEW IF NOT EXISTS latest_salary AS
+SELECT s.*
+FROM salaries s
+JOIN (
+    SELECT CAST(substr(MAX(
+               printf('%04d', year) || char(1) || COALESCE(source_date, '')
+               || char(1) || printf('%020d', id)
+           ), -20) AS INTEGER) AS id
+    FROM salaries
+    GROUP BY coach_id
+) latest ON latest.id = s.id;
+
+-- Trigram full-text index over coach names (backs /search LIKE lookups).
+-- Mirrors API_MIGRATIONS in api/main.py.
+CREATE VIRTUAL TABLE IF NOT EXISTS coach_fts USING fts5(
+    name, content='coaches', content_rowid='id', tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS coach_fts_ai AFTER INSERT ON coaches BEGIN
+    INSERT INTO coach_fts(rowid, name) VALUES (new.id, new.name);
+END;
+
+CREATE TRIGGER IF NOT EXISTS coach_fts_ad AFTER DELETE ON coaches BEGIN
+    INSERT INTO coach_fts(coach_fts, rowid, name) VALUES ('delete', old.id, old.name);
+END;
+
+CREATE TRIGGER IF NOT EXISTS coach_fts_au AFTER UPDATE OF name ON coaches BEGIN
+    INSERT INTO coach_fts(coach_fts, rowid, name) VALUES ('delete', old.id, old.name);
+    INSERT INTO coach_fts(rowid, name) VALUES (new.id, new.name);
+END;
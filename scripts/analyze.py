@@ -8,8 +8,13 @@ Usage:
 
 import argparse
 import json
+import sys
 from pathlib import Path
-from collections import defaultdict
+from heapq import nlargest
+
+# Row templates: ".25"/".20" truncate and pad each column in one step
+COACH_ROW = "{rank:>3}. {coach:<25.25} {school:<20.20} {pay:>15} {buyout:>15}"
+BUYOUT_ROW = "{rank:>3}. {coach:<25.25} {school:<20.20} {buyout:>15} {pay:>15}"
 
 def load_data(data_path: Path) -> dict:
     """Load coach data from JSON file."""
@@ -22,14 +27,20 @@ def format_money(amount: int | None) -> str:
         return "N/A"
     return f"${amount:,}"
 
-def print_coach(coach: dict, rank_width: int = 3):
-    """Print a single coach row."""
-    rank = str(coach["rank"]).rjust(rank_width)
-    name = coach["coach"][:25].ljust(25)
-    school = coach["school"][:20].ljust(20)
-    salary = format_money(coach.get("totalPay")).rjust(15)
-    buyout = format_money(coach.get("buyout")).rjust(15)
-    print(f"{rank}. {name} {school} {salary} {buyout}")
+def write_lines(lines: list):
+    """Write table rows to stdout in a single call."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+def format_coach(coach: dict, template: str = COACH_ROW, rank=None) -> str:
+    """Format a single coach row."""
+    return template.format(
+        rank=coach["rank"] if rank is None else rank,
+        coach=coach["coach"],
+        school=coach["school"],
+        pay=format_money(coach.get("totalPay")),
+        buyout=format_money(coach.get("buyout")),
+    )
 
 def top_coaches(coaches: list, n: int = 25):
     """Show top N highest paid coaches."""
@@ -39,35 +50,33 @@ def top_coaches(coaches: list, n: int = 25):
     print(f"{'#':>3}  {'Coach':<25} {'School':<20} {'Total Pay':>15} {'Buyout':>15}")
     print("-" * 80)
     
-    for coach in coaches[:n]:
-        print_coach(coach)
+    write_lines([format_coach(coach) for coach in coaches[:n]])
 
 def by_conference(coaches: list):
     """Show breakdown by conference."""
-    conf_data = defaultdict(list)
+    # Running totals per conference, built in a single pass
+    totals = {}
     for coach in coaches:
-        conf_data[coach["conference"]].append(coach)
+        t = totals.setdefault(coach["conference"], {"count": 0, "with_data": 0, "total": 0, "max": None, "min": None})
+        t["count"] += 1
+        pay = coach["totalPay"]
+        if pay:
+            t["with_data"] += 1
+            t["total"] += pay
+            if t["max"] is None or pay > t["max"]:
+                t["max"] = pay
+            if t["min"] is None or pay < t["min"]:
+                t["min"] = pay
     
     print(f"\n{'='*80}")
     print("SALARY BY CONFERENCE (2025)")
     print(f"{'='*80}")
     
-    conf_stats = []
-    for conf, conf_coaches in conf_data.items():
-        salaries = [c["totalPay"] for c in conf_coaches if c["totalPay"]]
-        if salaries:
-            avg = sum(salaries) // len(salaries)
-            max_sal = max(salaries)
-            min_sal = min(salaries)
-            conf_stats.append({
-                "conference": conf,
-                "count": len(conf_coaches),
-                "with_data": len(salaries),
-                "avg": avg,
-                "max": max_sal,
-                "min": min_sal,
-                "total": sum(salaries)
-            })
+    conf_stats = [
+        {"conference": conf, "avg": t["total"] // t["with_data"], **t}
+        for conf, t in totals.items()
+        if t["with_data"]
+    ]
     
     # Sort by average salary
     conf_stats.sort(key=lambda x: x["avg"], reverse=True)
@@ -75,8 +84,10 @@ def by_conference(coaches: list):
     print(f"{'Conference':<10} {'Teams':>6} {'Avg Salary':>15} {'Max':>15} {'Min':>15}")
     print("-" * 65)
     
-    for stat in conf_stats:
-        print(f"{stat['conference']:<10} {stat['with_data']:>6} {format_money(stat['avg']):>15} {format_money(stat['max']):>15} {format_money(stat['min']):>15}")
+    write_lines([
+        f"{stat['conference']:<10} {stat['with_data']:>6} {format_money(stat['avg']):>15} {format_money(stat['max']):>15} {format_money(stat['min']):>15}"
+        for stat in conf_stats
+    ])
 
 def filter_conference(coaches: list, conf: str):
     """Filter coaches by conference."""
@@ -86,7 +97,6 @@ def filter_conference(coaches: list, conf: str):
 def biggest_buyouts(coaches: list, n: int = 10):
     """Show coaches with biggest buyouts."""
     with_buyout = [c for c in coaches if c.get("buyout")]
-    with_buyout.sort(key=lambda x: x["buyout"], reverse=True)
     
     print(f"\n{'='*80}")
     print(f"TOP {n} BIGGEST BUYOUTS")
@@ -94,37 +104,37 @@ def biggest_buyouts(coaches: list, n: int = 10):
     print(f"{'#':>3}  {'Coach':<25} {'School':<20} {'Buyout':>15} {'Salary':>15}")
     print("-" * 80)
     
-    for i, coach in enumerate(with_buyout[:n], 1):
-        rank = str(i).rjust(3)
-        name = coach["coach"][:25].ljust(25)
-        school = coach["school"][:20].ljust(20)
-        buyout = format_money(coach.get("buyout")).rjust(15)
-        salary = format_money(coach.get("totalPay")).rjust(15)
-        print(f"{rank}. {name} {school} {buyout} {salary}")
+    write_lines([
+        format_coach(coach, BUYOUT_ROW, rank=i)
+        for i, coach in enumerate(nlargest(n, with_buyout, key=lambda x: x["buyout"]), 1)
+    ])
 
 def power_four_analysis(coaches: list):
     """Analyze Power Four conferences specifically."""
     power_four = ["SEC", "Big 10", "Big 12", "ACC"]
-    p4_coaches = [c for c in coaches if c["conference"] in power_four]
+    # One pass groups every Power Four coach by conference
+    conf_data = {conf: [] for conf in power_four}
+    for coach in coaches:
+        if coach["conference"] in conf_data:
+            conf_data[coach["conference"]].append(coach)
     
     print(f"\n{'='*80}")
     print("POWER FOUR ANALYSIS")
     print(f"{'='*80}")
     
-    for conf in power_four:
-        conf_coaches = [c for c in p4_coaches if c["conference"] == conf]
+    for conf, conf_coaches in conf_data.items():
         salaries = [c["totalPay"] for c in conf_coaches if c["totalPay"]]
         if salaries:
+            total = sum(salaries)
             print(f"\n{conf}:")
             print(f"  Coaches: {len(conf_coaches)}")
             print(f"  With salary data: {len(salaries)}")
-            print(f"  Average: {format_money(sum(salaries) // len(salaries))}")
-            print(f"  Total payroll: {format_money(sum(salaries))}")
+            print(f"  Average: {format_money(total // len(salaries))}")
+            print(f"  Total payroll: {format_money(total)}")
             
             # Top 3 in conference
-            conf_coaches_sorted = sorted(conf_coaches, key=lambda x: x["totalPay"] or 0, reverse=True)
             print(f"  Top 3:")
-            for c in conf_coaches_sorted[:3]:
+            for c in nlargest(3, conf_coaches, key=lambda x: x["totalPay"] or 0):
                 print(f"    - {c['coach']} ({c['school']}): {format_money(c['totalPay'])}")
 
 def main():
@@ -5,14 +5,32 @@ Tries common URL patterns on each school's athletic site.
 """
 
 import json
+import socket
+import threading
 import time
 import requests
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 import re
 from urllib.parse import urljoin, urlparse, parse_qs, unquote
 from datetime import datetime, date, timezone
 
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+# lxml is much faster than the pure-Python parser; use it when installed
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
 # FBS Schools with their athletic site domains
 # Format: (school_name, domain, conference)
 FBS_SCHOOLS = [
@@ -171,17 +189,134 @@ FBS_SCHOOLS = [
     ("Washington State", "wsucougars.com", "Independent"),
 ]
 
+# Only links are inspected, so skip building the rest of the tree
+LINKS_ONLY = SoupStrainer('a', href=True)
+
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
 }
 REQUEST_TIMEOUT = 12
 MAX_CANDIDATES_PER_SCHOOL = 20
 DDG_RESULT_LIMIT = 6
+MAX_CONCURRENT_SCHOOLS = 8
+MAX_PAGE_FETCHES = 4  # concurrent page/sitemap fetches per school
+MAX_URL_CHECKS = 8  # concurrent candidate validations per school
+MAX_REQUESTS_PER_HOST = 2  # in-flight cap per host, shared across schools
+# Every school goes through the search and reader services; space out request
+# starts there so they don't rate-limit us (seconds between requests)
+HOST_MIN_INTERVALS = {
+    'duckduckgo.com': 1.0,
+    'r.jina.ai': 0.5,
+}
+
+DNS_CACHE_TTL = 300  # seconds
+HTTP_CACHE_NAME = 'find_game_notes'
+HTTP_CACHE_EXPIRE = 86400  # seconds; re-runs within a day skip the network
+
+PDF_URL_RE = re.compile(r'https?://[^"\s>]+\.pdf', re.I)
+DOCUMENT_PDF_RE = re.compile(r'documents.*\d{4}.*\.pdf', re.I)
+SITEMAP_LOC_RE = re.compile(r'<loc>([^<]+)</loc>')
+URL_DATE_RES = [
+    re.compile(r'(?P<y>20\d{2})[/-](?P<m>\d{1,2})[/-](?P<d>\d{1,2})'),
+    re.compile(r'(?P<y>20\d{2})(?P<m>\d{2})(?P<d>\d{2})'),
+    re.compile(r'(?P<m>\d{1,2})[/-](?P<d>\d{1,2})[/-](?P<y>20\d{2})'),
+]
+
+
+def any_substring_re(substrings):
+    """One alternation that matches wherever any of the literal substrings occurs."""
+    return re.compile('|'.join(map(re.escape, substrings)))
+
+
+# Hint patterns are matched against lowercased hrefs/text in a single scan each
+NOTE_HREF_RE = any_substring_re(('game_notes', 'gamenotes', 'game-notes', 'notes.pdf',
+                                 'fb_notes', 'football_notes', 'postgame', 'pregame'))
+NOTE_TEXT_RE = any_substring_re(('game notes', 'gamenotes', 'postgame notes', 'pregame notes'))
+DOCUMENT_HINT_RE = any_substring_re(('football', 'fb_', 'fb-', '/fb/', 'notes'))
+SITEMAP_HINT_RE = any_substring_re(('football', 'game', 'notes', 'fb'))
+SCORE_WEIGHTS = (
+    ('game notes', 8),
+    ('gamenotes', 7),
+    ('game-notes', 7),
+    ('game_notes', 7),
+    ('football', 5),
+    ('/fb/', 3),
+    ('fb_', 3),
+    ('fb-', 3),
+    ('postgame', 2),
+    ('pregame', 2),
+    ('notes', 2),
+)
+
+_host_slots = {}
+_host_slots_lock = threading.Lock()
+_host_next_start = {}
+_dns_cache = {}
+_dns_cache_lock = threading.Lock()
+_system_getaddrinfo = socket.getaddrinfo
+
+
+def cached_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+    """socket.getaddrinfo with a TTL cache; failed lookups are not cached."""
+    key = (host, port, family, type, proto, flags)
+    now = time.monotonic()
+    with _dns_cache_lock:
+        hit = _dns_cache.get(key)
+    if hit and hit[0] > now:
+        return hit[1]
+    result = _system_getaddrinfo(host, port, family, type, proto, flags)
+    with _dns_cache_lock:
+        _dns_cache[key] = (now + DNS_CACHE_TTL, result)
+    return result
+
+
+@contextmanager
+def host_slot(url):
+    """Hold one of the in-flight slots for the host of `url`.
+
+    Hosts listed in HOST_MIN_INTERVALS additionally wait their turn so
+    request starts are at least that far apart.
+    """
+    host = urlparse(url).netloc.lower()
+    interval = HOST_MIN_INTERVALS.get(host)
+    with _host_slots_lock:
+        slot = _host_slots.get(host)
+        if slot is None:
+            slot = _host_slots[host] = threading.BoundedSemaphore(MAX_REQUESTS_PER_HOST)
+    with slot:
+        if interval:
+            with _host_slots_lock:
+                now = time.monotonic()
+                start = max(now, _host_next_start.get(host, now))
+                _host_next_start[host] = start + interval
+            if start > now:
+                time.sleep(start - now)
+        yield
 
 
 def build_session():
-    session = requests.Session()
+    if requests_cache is not None:
+        # Persistent SQLite cache in the user cache dir; expired entries with an
+        # ETag/Last-Modified are revalidated with a conditional request
+        session = requests_cache.CachedSession(
+            HTTP_CACHE_NAME,
+            backend='sqlite',
+            use_cache_dir=True,
+            expire_after=HTTP_CACHE_EXPIRE,
+            allowable_methods=('GET', 'HEAD'),
+        )
+    else:
+        session = requests.Session()
     session.headers.update(HEADERS)
+    # Keep a keep-alive pool for every school site plus r.jina.ai and DuckDuckGo,
+    # each sized to the per-host cap, and retry transient gateway errors
+    adapter = HTTPAdapter(
+        pool_connections=256,
+        pool_maxsize=MAX_REQUESTS_PER_HOST,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504], raise_on_status=False),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
     return session
 
 
@@ -193,13 +328,23 @@ def is_pdf_response(resp, url):
 def check_url_exists(session, url):
     """Check if a URL exists and is a PDF."""
     try:
-        resp = session.head(url, timeout=REQUEST_TIMEOUT, allow_redirects=True)
-        if resp.status_code == 200 and is_pdf_response(resp, url):
-            return True
-        if resp.status_code in {403, 405}:
-            resp = session.get(url, timeout=REQUEST_TIMEOUT, allow_redirects=True, stream=True)
+        with host_slot(url):
+            resp = session.head(url, timeout=REQUEST_TIMEOUT, allow_redirects=True)
             if resp.status_code == 200 and is_pdf_response(resp, url):
                 return True
+            if resp.status_code in {403, 405, 501}:
+                # Sites that reject HEAD: ask for just the first bytes and
+                # check for the PDF magic number instead of downloading the file.
+                # The HTTP cache keys ignore Range, so a server that answers 200
+                # would have its whole body read in to be stored; no-store keeps
+                # this probe out of the cache (per request, unlike the
+                # session-wide and thread-unsafe cache_disabled())
+                with session.get(url, headers={'Range': 'bytes=0-3', 'Cache-Control': 'no-store'},
+                                 timeout=REQUEST_TIMEOUT, allow_redirects=True, stream=True) as resp:
+                    if resp.status_code not in {200, 206}:
+                        return False
+                    head = next(resp.iter_content(4), b'')
+                    return head.startswith(b'%PDF') or is_pdf_response(resp, url)
         return False
     except requests.RequestException:
         return False
@@ -207,9 +352,12 @@ def check_url_exists(session, url):
 
 def fetch_url(session, url):
     try:
-        resp = session.get(url, timeout=REQUEST_TIMEOUT)
+        with host_slot(url):
+            resp = session.get(url, timeout=REQUEST_TIMEOUT)
         if resp.status_code == 200:
             return resp.text
+        if resp.status_code == 429:
+            print(f"    Rate limited by {urlparse(url).netloc}")
     except requests.RequestException:
         return None
     return None
@@ -223,7 +371,7 @@ def fetch_with_jina(session, url):
 def extract_pdf_links(html, base_url):
     if not html:
         return []
-    soup = BeautifulSoup(html, 'html.parser')
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=LINKS_ONLY)
     links = set()
 
     for link in soup.find_all('a', href=True):
@@ -232,42 +380,21 @@ def extract_pdf_links(html, base_url):
             links.add(urljoin(base_url, href))
 
     # Also scan raw HTML for PDF links (some are embedded in scripts)
-    for match in re.findall(r'https?://[^"\\s>]+\\.pdf', html, re.I):
+    for match in PDF_URL_RE.findall(html):
         links.add(match)
 
     return list(links)
 
 
 def score_url(url):
+    # Keywords overlap ('gamenotes' also scores 'notes'), so each is tested on its own
     url_lower = url.lower()
-    score = 0
-    keywords = {
-        'game notes': 8,
-        'gamenotes': 7,
-        'game-notes': 7,
-        'game_notes': 7,
-        'football': 5,
-        '/fb/': 3,
-        'fb_': 3,
-        'fb-': 3,
-        'postgame': 2,
-        'pregame': 2,
-        'notes': 2,
-    }
-    for key, weight in keywords.items():
-        if key in url_lower:
-            score += weight
-    return score
+    return sum(weight for key, weight in SCORE_WEIGHTS if key in url_lower)
 
 
 def extract_date_from_url(url):
-    patterns = [
-        r'(?P<y>20\\d{2})[/-](?P<m>\\d{1,2})[/-](?P<d>\\d{1,2})',
-        r'(?P<y>20\\d{2})(?P<m>\\d{2})(?P<d>\\d{2})',
-        r'(?P<m>\\d{1,2})[/-](?P<d>\\d{1,2})[/-](?P<y>20\\d{2})',
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, url)
+    for pattern in URL_DATE_RES:
+        match = pattern.search(url)
         if match:
             try:
                 return date(int(match.group('y')), int(match.group('m')), int(match.group('d')))
@@ -293,7 +420,13 @@ def search_for_game_notes(session, domain):
     Returns list of potential game notes URLs.
     """
     potential_urls = []
+    seen = set()
     base_url = f"https://{domain}"
+
+    def add_url(url):
+        if url not in seen:
+            seen.add(url)
+            potential_urls.append(url)
     
     # Common pages where game notes might be linked
     search_pages = [
@@ -307,45 +440,45 @@ def search_for_game_notes(session, domain):
         f"{base_url}/sports/football/archives",
     ]
     
-    for page_url in search_pages:
+    def fetch_page(page_url):
+        return fetch_url(session, page_url) or fetch_with_jina(session, page_url)
+
+    # Fetch the pages concurrently; results still come back in search_pages order
+    with ThreadPoolExecutor(max_workers=MAX_PAGE_FETCHES) as pool:
+        pages = list(pool.map(fetch_page, search_pages))
+
+    for page_url, html in zip(search_pages, pages):
         try:
-            html = fetch_url(session, page_url)
-            if not html:
-                html = fetch_with_jina(session, page_url)
             if not html:
                 continue
 
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            # Find all links that might be game notes
+            soup = BeautifulSoup(html, HTML_PARSER, parse_only=LINKS_ONLY)
+
+            # One pass over the anchors; document-path PDFs are still added
+            # after the pattern matches, as before
+            document_urls = []
             for link in soup.find_all('a', href=True):
-                href = link['href'].lower()
+                raw_href = link['href']
+                href = raw_href.lower()
                 text = link.get_text().lower()
-                
+
                 # Look for game notes indicators in URL
-                note_patterns = ['game_notes', 'gamenotes', 'game-notes', 'notes.pdf', 
-                                'fb_notes', 'football_notes', 'postgame', 'pregame']
-                if any(x in href for x in note_patterns):
-                    full_url = urljoin(base_url, link['href'])
-                    if full_url not in potential_urls and '.pdf' in full_url.lower():
-                        potential_urls.append(full_url)
-                        
+                if NOTE_HREF_RE.search(href):
+                    full_url = urljoin(base_url, raw_href)
+                    if '.pdf' in full_url.lower():
+                        add_url(full_url)
+
                 # Look for game notes indicators in link text
-                text_patterns = ['game notes', 'gamenotes', 'postgame notes', 'pregame notes']
-                if any(x in text for x in text_patterns):
-                    full_url = urljoin(base_url, link['href'])
-                    if full_url not in potential_urls:
-                        potential_urls.append(full_url)
-                        
-            # Also look in document download paths
-            for link in soup.find_all('a', href=re.compile(r'documents.*\d{4}.*\.pdf', re.I)):
-                href = link['href']
-                # Check if it might be football related
-                if any(x in href.lower() for x in ['football', 'fb_', 'fb-', '/fb/', 'notes']):
-                    full_url = urljoin(base_url, href)
-                    if full_url not in potential_urls:
-                        potential_urls.append(full_url)
-                    
+                if NOTE_TEXT_RE.search(text):
+                    add_url(urljoin(base_url, raw_href))
+
+                # Also look in document download paths that might be football related
+                if DOCUMENT_PDF_RE.search(raw_href) and DOCUMENT_HINT_RE.search(href):
+                    document_urls.append(urljoin(base_url, raw_href))
+
+            for full_url in document_urls:
+                add_url(full_url)
+
         except Exception as e:
             print(f"    Error searching {page_url}: {e}")
             continue
@@ -378,10 +511,15 @@ def try_common_patterns(domain, school_name):
     return patterns
 
 
+def is_notes_pdf_loc(loc):
+    loc_lower = loc.lower()
+    return '.pdf' in loc_lower and SITEMAP_HINT_RE.search(loc_lower) is not None
+
+
 def parse_sitemap_locs(xml_text):
     if not xml_text:
         return []
-    return re.findall(r'<loc>([^<]+)</loc>', xml_text)
+    return SITEMAP_LOC_RE.findall(xml_text)
 
 
 def fetch_sitemap_urls(session, domain):
@@ -403,6 +541,7 @@ def fetch_sitemap_urls(session, domain):
         ]
 
     seen_sitemaps = set()
+    seen_nested = set()
     for sitemap_url in sitemap_urls:
         if sitemap_url in seen_sitemaps:
             continue
@@ -416,13 +555,21 @@ def fetch_sitemap_urls(session, domain):
         url_locs = [loc for loc in locs if not loc.endswith(".xml")]
 
         for loc in url_locs:
-            if '.pdf' in loc.lower() and any(x in loc.lower() for x in ['football', 'game', 'notes', 'fb']):
+            if is_notes_pdf_loc(loc):
                 candidates.append(loc)
 
+        # Index sitemaps often list the same child sitemap; fetch the new ones
+        # concurrently and parse them in order
+        to_fetch = []
         for nested_url in nested[:6]:
-            nested_xml = fetch_url(session, nested_url)
+            if nested_url not in seen_nested:
+                seen_nested.add(nested_url)
+                to_fetch.append(nested_url)
+        with ThreadPoolExecutor(max_workers=MAX_PAGE_FETCHES) as pool:
+            nested_xmls = list(pool.map(lambda url: fetch_url(session, url), to_fetch))
+        for nested_xml in nested_xmls:
             for loc in parse_sitemap_locs(nested_xml):
-                if '.pdf' in loc.lower() and any(x in loc.lower() for x in ['football', 'game', 'notes', 'fb']):
+                if is_notes_pdf_loc(loc):
                     candidates.append(loc)
 
     return list(dict.fromkeys(candidates))
@@ -440,7 +587,7 @@ def search_duckduckgo(session, domain):
         html = fetch_url(session, url)
         if not html:
             continue
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, HTML_PARSER, parse_only=LINKS_ONLY)
         for link in soup.select("a.result__a")[:DDG_RESULT_LIMIT]:
             href = link.get("href", "")
             if "uddg=" in href:
@@ -473,12 +620,16 @@ def find_game_notes_for_school(session, school_name, domain, conference):
         html = fetch_url(session, result_url)
         found_urls.extend(extract_pdf_links(html, result_url))
     
-    # Validate found URLs (check if they're actually PDFs)
+    # Validate found URLs (check if they're actually PDFs) concurrently;
+    # host_slot() still caps how many hit the same host at once
+    candidates = found_urls[:MAX_CANDIDATES_PER_SCHOOL]
+    with ThreadPoolExecutor(max_workers=MAX_URL_CHECKS) as pool:
+        checks = list(pool.map(lambda url: check_url_exists(session, url), candidates))
     valid_urls = []
-    for url in found_urls[:MAX_CANDIDATES_PER_SCHOOL]:
-        if check_url_exists(session, url):
+    for url, ok in zip(candidates, checks):
+        if ok:
             valid_urls.append(url)
-            print(f"  ✓ Found: {url[:80]}...")
+            print(f"  {school_name}: ✓ Found: {url[:80]}...")
     
     if valid_urls:
         latest_url = select_latest_url(valid_urls)
@@ -495,7 +646,7 @@ def find_game_notes_for_school(session, school_name, domain, conference):
     patterns = try_common_patterns(domain, school_name)
     for url in patterns[:5]:  # Limit pattern checks
         if check_url_exists(session, url):
-            print(f"  ✓ Found via pattern: {url[:80]}...")
+            print(f"  {school_name}: ✓ Found via pattern: {url[:80]}...")
             return {
                 "school": school_name,
                 "domain": domain,
@@ -505,7 +656,7 @@ def find_game_notes_for_school(session, school_name, domain, conference):
                 "status": "found"
             }
     
-    print(f"  ✗ Not found")
+    print(f"  {school_name}: ✗ Not found")
     return {
         "school": school_name,
         "domain": domain,
@@ -516,6 +667,19 @@ def find_game_notes_for_school(session, school_name, domain, conference):
     }
 
 
+def scan_school(session, school_name, domain, conference):
+    """Run find_game_notes_for_school, logging failures instead of raising.
+
+    A failed school returns None and is left out of the results so the next
+    run retries it.
+    """
+    try:
+        return find_game_notes_for_school(session, school_name, domain, conference)
+    except Exception as e:
+        print(f"  {school_name}: ✗ Error: {e}")
+        return None
+
+
 def main():
     """Main scraper function."""
     output_path = Path(__file__).parent.parent / "data" / "game_notes_urls.json"
@@ -537,43 +701,56 @@ def main():
     # Get list of already processed schools
     processed = {r["school"] for r in results}
     
-    # Process schools
+    pending = []
+    for school in FBS_SCHOOLS:
+        if school[0] in processed:
+            print(f"Skipping {school[0]} (already processed)")
+            continue
+        pending.append(school)
+
+    # Process schools concurrently; host_slot() keeps each site (and the shared
+    # search/reader hosts) to a couple of in-flight requests
     found_count = 0
+    # Every school site is hit 10+ times; resolve each host once per TTL
+    socket.getaddrinfo = cached_getaddrinfo
     session = build_session()
-    for school_name, domain, conference in FBS_SCHOOLS:
-        if school_name in processed:
-            print(f"Skipping {school_name} (already processed)")
-            continue
-            
-        result = find_game_notes_for_school(session, school_name, domain, conference)
-        results.append(result)
-        
-        if result["status"] == "found":
-            found_count += 1
-        
-        # Save progress after each school
-        with open(output_path, 'w') as f:
-            json.dump({
-                "metadata": {
-                    "total_schools": len(FBS_SCHOOLS),
-                    "processed": len(results),
-                    "found": sum(1 for r in results if r["status"] == "found"),
-                },
-                "schools": results
-            }, f, indent=2)
-
-        with open(mapping_path, 'w') as f:
-            mapping = {
-                "generated_at": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
-                "schools": {
-                    r["school"]: r.get("latest_game_notes_url")
-                    for r in results
-                    if r.get("latest_game_notes_url")
+    pool = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_SCHOOLS)
+    try:
+        futures = [pool.submit(scan_school, session, *school) for school in pending]
+        for future in futures:
+            result = future.result()
+            if result is None:
+                continue
+            results.append(result)
+
+            if result["status"] == "found":
+                found_count += 1
+
+            # Save progress after each school
+            with open(output_path, 'w') as f:
+                json.dump({
+                    "metadata": {
+                        "total_schools": len(FBS_SCHOOLS),
+                        "processed": len(results),
+                        "found": sum(1 for r in results if r["status"] == "found"),
+                    },
+                    "schools": results
+                }, f, indent=2)
+
+            with open(mapping_path, 'w') as f:
+                mapping = {
+                    "generated_at": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+                    "schools": {
+                        r["school"]: r.get("latest_game_notes_url")
+                        for r in results
+                        if r.get("latest_game_notes_url")
+                    }
                 }
-            }
-            json.dump(mapping, f, indent=2)
-        
-        time.sleep(0.5)  # Be nice to servers
+                json.dump(mapping, f, indent=2)
+    finally:
+        # On Ctrl-C drop the queued schools instead of running them all;
+        # progress up to the last finished school is already saved
+        pool.shutdown(cancel_futures=True)
     
     print(f"\n{'='*50}")
     print(f"Total: {len(results)} schools processed")
@@ -12,6 +12,14 @@ COACH_DB = CLAWD_DIR / "coach-database" / "db" / "coaches.db"
 PBP_JSON = CLAWD_DIR / "pbp-analysis" / "data.json"
 OUTPUT_DIR = CLAWD_DIR / "coach-database" / "output"
 
+OC_KEYWORDS = (
+    "offensive coordinator",
+    "offensive coord",
+    "play caller",
+    "pass game coord",
+)
+DC_KEYWORDS = ("defensive coordinator", "defensive coord")
+
 NCAA_SCOREBOARD = (
     "https://data.ncaa.com/casablanca/scoreboard/football/fbs/{year}/{week:02d}/scoreboard.json"
 )
@@ -135,35 +143,25 @@ def get_play_caller(db: sqlite3.Connection, school_id: int, season: int) -> dict
 def extract_key_coaches(staff: list[dict], play_caller: dict | None) -> dict:
     head_coach = next((c for c in staff if c.get("is_head_coach")), None)
 
-    oc_keywords = [
-        "offensive coordinator",
-        "offensive coord",
-        "play caller",
-        "pass game coord",
-    ]
-    oc_candidates = [
-        c
-        for c in staff
-        if not c.get("is_head_coach")
-        and c.get("position")
-        and any(kw in c["position"].lower() for kw in oc_keywords)
-    ]
+    # Lowercase each title once and match it against both keyword sets
+    oc_candidates = []
+    dc_candidates = []
+    for c in staff:
+        if c.get("is_head_coach") or not c.get("position"):
+            continue
+        position = c["position"].lower()
+        if any(kw in position for kw in OC_KEYWORDS):
+            oc_candidates.append((position, c))
+        if any(kw in position for kw in DC_KEYWORDS):
+            dc_candidates.append((position, c))
+
     oc = next(
-        (c for c in oc_candidates if "co-offensive" not in c["position"].lower()),
-        oc_candidates[0] if oc_candidates else None,
+        (c for position, c in oc_candidates if "co-offensive" not in position),
+        oc_candidates[0][1] if oc_candidates else None,
     )
-
-    dc_keywords = ["defensive coordinator", "defensive coord"]
-    dc_candidates = [
-        c
-        for c in staff
-        if not c.get("is_head_coach")
-        and c.get("position")
-        and any(kw in c["position"].lower() for kw in dc_keywords)
-    ]
     dc = next(
-        (c for c in dc_candidates if "co-defensive" not in c["position"].lower()),
-        dc_candidates[0] if dc_candidates else None,
+        (c for position, c in dc_candidates if "co-defensive" not in position),
+        dc_candidates[0][1] if dc_candidates else None,
     )
 
     result = {
@@ -22,12 +22,15 @@ import os
 import re
 import sqlite3
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
 
 
 DB_PATH_DEFAULT = Path(__file__).resolve().parent.parent / "db" / "coaches.db"
@@ -35,9 +38,41 @@ OUTPUT_PATH_DEFAULT = Path("/tmp/salary_sweep_2026.json")
 PERPLEXITY_URL = "https://api.perplexity.ai/chat/completions"
 PERPLEXITY_MODEL = "sonar-pro"
 PERPLEXITY_SOURCE = "perplexity_sonar_pro"
-API_DELAY_SECONDS = 2.0
+API_DELAY_SECONDS = 2.0  # minimum spacing between request starts
+DEFAULT_WORKERS = 4
 ANNUAL_SALARY_CEILING = 25_000_000
 
+# One pooled, keep-alive session so each query skips the TCP/TLS handshake.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=8))
+
+HEAD_COACHES_SQL = """
+WITH ranked AS (
+    SELECT
+        c.id AS coach_id,
+        c.name AS coach_name,
+        c.school_id AS school_id,
+        s.name AS school_name,
+        co.abbrev AS conference_abbrev,
+        co.name AS conference_name,
+        ROW_NUMBER() OVER (PARTITION BY c.school_id ORDER BY c.id ASC) AS rn
+    FROM coaches c
+    JOIN schools s ON c.school_id = s.id
+    LEFT JOIN conferences co ON s.conference_id = co.id
+    WHERE c.year = 2025
+      AND c.is_head_coach = 1
+)
+SELECT coach_id, coach_name, school_name, conference_abbrev, conference_name
+FROM ranked
+WHERE rn = 1
+"""
+HEAD_COACHES_CONFERENCE_FILTER_SQL = """
+AND (
+    UPPER(COALESCE(conference_abbrev, '')) = UPPER(?)
+    OR UPPER(COALESCE(conference_name, '')) LIKE '%' || UPPER(?) || '%'
+)
+"""
+
 
 @dataclass
 class CoachRow:
@@ -49,6 +84,23 @@ class CoachRow:
     total_pay_2025: int | None = None
 
 
+class RequestThrottle:
+    """Spaces request starts at least `interval` seconds apart across threads."""
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._next_start = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_start - now
+            self._next_start = max(now, self._next_start) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
 def table_exists(conn: sqlite3.Connection, table_name: str) -> bool:
     row = conn.execute(
         "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?",
@@ -179,7 +231,7 @@ def perplexity_query(prompt: str, api_key: str, timeout: int = 90) -> tuple[str,
         "temperature": 0,
     }
 
-    response = requests.post(
+    response = SESSION.post(
         PERPLEXITY_URL,
         headers=headers,
         json=payload,
@@ -231,34 +283,10 @@ def load_head_coaches(conn: sqlite3.Connection, conference_filter: str | None) -
     params: list[Any] = []
 
     if has_schools:
-        query = """
-        WITH ranked AS (
-            SELECT
-                c.id AS coach_id,
-                c.name AS coach_name,
-                c.school_id AS school_id,
-                s.name AS school_name,
-                co.abbrev AS conference_abbrev,
-                co.name AS conference_name,
-                ROW_NUMBER() OVER (PARTITION BY c.school_id ORDER BY c.id ASC) AS rn
-            FROM coaches c
-            JOIN schools s ON c.school_id = s.id
-            LEFT JOIN conferences co ON s.conference_id = co.id
-            WHERE c.year = 2025
-              AND c.is_head_coach = 1
-        )
-        SELECT coach_id, coach_name, school_name, conference_abbrev, conference_name
-        FROM ranked
-        WHERE rn = 1
-        """
+        query = HEAD_COACHES_SQL
         if conference_filter:
             if has_conferences:
-                query += """
-                AND (
-                    UPPER(COALESCE(conference_abbrev, '')) = UPPER(?)
-                    OR UPPER(COALESCE(conference_name, '')) LIKE '%' || UPPER(?) || '%'
-                )
-                """
+                query += HEAD_COACHES_CONFERENCE_FILTER_SQL
                 params.extend([conference_filter, conference_filter])
             else:
                 print(
@@ -329,17 +357,14 @@ def load_head_coaches(conn: sqlite3.Connection, conference_filter: str | None) -
         rows = conn.execute(query, tuple(params)).fetchall()
 
     result: list[CoachRow] = []
-    for r in rows:
-        coach_id = int(r["coach_id"])
-        coach_name = str(r["coach_name"]).strip()
-        school_name = str(r["school_name"]).strip()
-        conference_abbrev = r["conference_abbrev"]
-        conference_name = r["conference_name"]
+    # Both queries select the same five columns in this order
+    for coach_id, coach_name, school_name, conference_abbrev, conference_name in rows:
+        coach_id = int(coach_id)
         result.append(
             CoachRow(
                 coach_id=coach_id,
-                coach_name=coach_name,
-                school_name=school_name,
+                coach_name=str(coach_name).strip(),
+                school_name=str(school_name).strip(),
                 conference_abbrev=str(conference_abbrev) if conference_abbrev else None,
                 conference_name=str(conference_name) if conference_name else None,
                 total_pay_2025=salary_2025.get(coach_id),
@@ -452,6 +477,12 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--dry-run", action="store_true", help="Print prompts only; do not call Perplexity API.")
     parser.add_argument("--conference", type=str, help="Conference filter (e.g. SEC).")
     parser.add_argument("--import", dest="do_import", action="store_true", help="Import verified 2026 salary results into salaries table.")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Concurrent Perplexity requests (default: {DEFAULT_WORKERS}).",
+    )
     return parser.parse_args()
 
 
@@ -476,34 +507,49 @@ def main() -> int:
             print("No 2025 head coaches found for the requested filter.")
             return 0
 
-        results: list[dict[str, Any]] = []
-        for idx, coach in enumerate(coaches, start=1):
-            prompt = build_prompt(coach.coach_name, coach.school_name)
-            if args.dry_run:
-                print(f"[DRY-RUN {idx}/{len(coaches)}] {coach.coach_name} ({coach.school_name})")
-                print(f"Prompt: {prompt}\n")
-                raw_response = ""
-                source_url = None
-                total_pay_2026 = None
-                _notes = ""
-            else:
-                if idx > 1:
-                    time.sleep(API_DELAY_SECONDS)
+        # Perplexity calls are I/O bound: run them on a small thread pool, with
+        # request starts still spaced API_DELAY_SECONDS apart, and keep the
+        # results in coach order.
+        fetched: list[tuple[str, str | None, int | None, str]] = []
+        if not args.dry_run:
+            throttle = RequestThrottle(API_DELAY_SECONDS)
 
+            def fetch(idx: int, coach: CoachRow) -> tuple[str, str | None, int | None, str]:
+                throttle.wait()
                 try:
-                    raw_response, source_url = perplexity_query(prompt, api_key=api_key)
+                    raw_response, source_url = perplexity_query(
+                        build_prompt(coach.coach_name, coach.school_name),
+                        api_key=api_key,
+                    )
                     total_pay_2026 = extract_total_pay(raw_response)
-                    _notes = extract_notes(raw_response)
+                    notes = extract_notes(raw_response)
                 except requests.RequestException as exc:
                     raw_response = f"API_ERROR: {exc}"
                     source_url = None
                     total_pay_2026 = None
-                    _notes = ""
+                    notes = ""
 
                 print(
                     f"[{idx}/{len(coaches)}] {coach.coach_name} ({coach.school_name}) -> "
                     f"{money_to_str(total_pay_2026)} | {source_url or 'no citation'}"
                 )
+                return raw_response, source_url, total_pay_2026, notes
+
+            with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+                fetched = list(pool.map(fetch, range(1, len(coaches) + 1), coaches))
+
+        results: list[dict[str, Any]] = []
+        for idx, coach in enumerate(coaches, start=1):
+            if args.dry_run:
+                prompt = build_prompt(coach.coach_name, coach.school_name)
+                print(f"[DRY-RUN {idx}/{len(coaches)}] {coach.coach_name} ({coach.school_name})")
+                print(f"Prompt: {prompt}\n")
+                raw_response = ""
+                source_url = None
+                total_pay_2026 = None
+                _notes = ""
+            else:
+                raw_response, source_url, total_pay_2026, _notes = fetched[idx - 1]
 
             pay_2025 = coach.total_pay_2025
             delta = None
@@ -25,6 +25,8 @@ import json
 import hashlib
 import logging
 import argparse
+import functools
+import re
 import feedparser
 import requests
 from datetime import datetime, timedelta
@@ -237,10 +239,17 @@ def search_brave(query: str, api_key: str, days: int = 7) -> List[Dict]:
 # CONTENT FILTERING
 # ============================================================================
 
+@functools.lru_cache(maxsize=8)
+def _keyword_pattern(keywords: tuple) -> re.Pattern:
+    """Compile keywords into one alternation so each article is scanned once"""
+    return re.compile("|".join(map(re.escape, keywords)))
+
 def is_coaching_related(article: Dict, keywords: List[str]) -> bool:
     """Check if article is related to coaching changes"""
+    if not keywords:
+        return False
     text = f"{article['title']} {article['description']}".lower()
-    return any(keyword in text for keyword in keywords)
+    return _keyword_pattern(tuple(keywords)).search(text) is not None
 
 def generate_content_hash(article: Dict) -> str:
     """Generate unique hash for article content"""
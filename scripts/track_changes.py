@@ -82,6 +82,7 @@ def build_school_index(coaches: list[dict[str, Any]]) -> dict[str, dict[str, Any
             "coach": coach.get("coach"),
             "school": school,
             "conference": coach.get("conference"),
+            "coach_key": normalize_text(coach.get("coach")),
         }
     return index
 
@@ -98,6 +99,7 @@ def build_coach_index(coaches: list[dict[str, Any]]) -> dict[str, dict[str, Any]
             "coach": name,
             "school": school,
             "conference": coach.get("conference"),
+            "school_key": normalize_text(school),
         }
     return index
 
@@ -120,7 +122,7 @@ def detect_changes(previous: dict[str, Any], current: dict[str, Any], run_timest
     # Detect new hires and departures by school
     for school_key, curr in curr_by_school.items():
         prev = prev_by_school.get(school_key)
-        if not prev:
+        if prev is None:
             events.append({
                 "timestamp": run_timestamp,
                 "changeType": "new_hire",
@@ -131,7 +133,8 @@ def detect_changes(previous: dict[str, Any], current: dict[str, Any], run_timest
                 "alert": is_power_four(curr.get("conference")),
             })
             continue
-        if normalize_text(prev.get("coach")) != normalize_text(curr.get("coach")):
+        # coach_key/school_key are normalized once in the index builders
+        if prev["coach_key"] != curr["coach_key"]:
             events.append({
                 "timestamp": run_timestamp,
                 "changeType": "new_hire",
@@ -166,9 +169,7 @@ def detect_changes(previous: dict[str, Any], current: dict[str, Any], run_timest
     # Detect position changes (coach moves to a different school)
     for coach_key, prev in prev_by_coach.items():
         curr = curr_by_coach.get(coach_key)
-        if not curr:
-            continue
-        if normalize_text(prev.get("school")) != normalize_text(curr.get("school")):
+        if curr is not None and prev["school_key"] != curr["school_key"]:
             alert = is_power_four(curr.get("conference")) or is_power_four(prev.get("conference"))
             events.append({
                 "timestamp": run_timestamp,
@@ -0,0 +1,46 @@
+"""Tests for the /coaches position filter (SQLite LIKE semantics).
+
+Run with: python -m unittest discover tests
+"""
+
+import sqlite3
+import sys
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from api.main import _like_matcher  # noqa: E402
+
+POSITIONS = [
+    "Head Coach",
+    "Offensive Coordinator/QBs",
+    "Defensive Line",
+    "Special Teams Coordinator",
+    "Co-Defensive Coordinator / Linebackers",
+    "Director of Football Operations",
+]
+
+
+class LikeMatcherTest(unittest.TestCase):
+    def test_matches_sqlite_like(self):
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE TABLE t (position TEXT)")
+        conn.executemany("INSERT INTO t VALUES (?)", [(p,) for p in POSITIONS])
+        for needle in ["", "%", "coord", "COORD", "o_f", "%o%c%", "_o_", "line", "q_s", "ne__", "zzz"]:
+            expected = {row[0] for row in conn.execute("SELECT position FROM t WHERE position LIKE ?",
+                                                       (f"%{needle}%",))}
+            matches = _like_matcher(needle)
+            self.assertEqual({p for p in POSITIONS if matches(p)}, expected, needle)
+
+    def test_percent_heavy_needle_is_fast(self):
+        matches = _like_matcher("%" * 12 + "zzz")
+        started = time.monotonic()
+        for position in POSITIONS * 100:
+            self.assertFalse(matches(position))
+        self.assertLess(time.monotonic() - started, 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()